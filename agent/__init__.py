@@ -2,11 +2,17 @@
 Kubernetes agent module with LangGraph integration.
 """
 
-# Import the new LangGraph agent
-from .langgraph_agent import KubernetesGraphAgent, create_kubernetes_agent
+# The LangGraph agent is imported on first access (PEP 562) so that importing
+# this package doesn't pull in langgraph/langchain/boto3 until it's needed.
+__all__ = ['KubernetesAgent', 'KubernetesGraphAgent', 'create_kubernetes_agent']
 
-# Export the LangGraph agent as the main agent
-KubernetesAgent = KubernetesGraphAgent
 
-# Keep the factory function
-__all__ = ['KubernetesAgent', 'create_kubernetes_agent']
+def __getattr__(name):
+    if name in __all__:
+        from . import langgraph_agent
+        
+        # Export the LangGraph agent as the main agent
+        if name == 'KubernetesAgent':
+            return langgraph_agent.KubernetesGraphAgent
+        return getattr(langgraph_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
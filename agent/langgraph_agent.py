@@ -3,46 +3,152 @@ LangGraph-based Kubernetes agent.
 Simple and reliable without Pydantic complexities.
 """
 
+import functools
 import json
+import os
+import queue
 import re
-from typing import Dict, Any, List
-from langgraph.graph import StateGraph, END
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain.schema import BaseMessage
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, ClassVar, Iterator
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
 import logging
 
-from bedrock import create_bedrock_llm
+from bedrock import MockLLM, create_bedrock_llm
 from tools.simple_tools import AVAILABLE_TOOLS, initialize_k8s_client
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared pool for running independent tool calls from one agent turn concurrently
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=len(AVAILABLE_TOOLS), thread_name_prefix="agent-tool")
 
-class KubernetesGraphAgent:
-    """LangGraph-based Kubernetes assistant."""
+# Message name marking tool output, so the history trimmer can find it
+_TOOL_RESULT_NAME = "tool_result"
+
+# Prompt budget per agent turn, estimated at ~4 characters per token
+_MAX_PROMPT_TOKENS = 2000
+_CHARS_PER_TOKEN = 4
+_TRUNCATED_RESULT_CHARS = 500
+
+# Marks the end of a streamed agent run on the stream queue
+_STREAM_END = object()
+
+# Where JSON tool-call text can start: an object, or an array of several calls
+_TOOL_JSON_START = re.compile(r"[{\[]")
+
+
+def _iter_json_objects(text: str):
+    """Yield balanced top-level {...} substrings, ignoring braces inside string literals."""
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            if depth:
+                in_string = True
+        elif char == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+
+def _content_text(content) -> str:
+    """Text of a message content, which is a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+def _message_chars(message) -> int:
+    """Approximate size of a message's text content."""
+    return len(_content_text(message.content))
+
+
+def _trim_messages(messages: List[Any], max_tokens: int = _MAX_PROMPT_TOKENS) -> List[Any]:
+    """
+    Keep the prompt bounded instead of resending the whole history every turn.
+    
+    The system prompt, user messages and the two most recent tool results are kept
+    verbatim; older tool results are truncated and repeated AI messages are dropped.
+    AI messages that request tools are always kept, so every ToolMessage keeps the
+    tool call it answers.
+    """
+    if sum(_message_chars(m) for m in messages) <= max_tokens * _CHARS_PER_TOKEN:
+        return messages
+    
+    result_indexes = [i for i, m in enumerate(messages) if getattr(m, "name", None) == _TOOL_RESULT_NAME]
+    recent_results = set(result_indexes[-2:])
+    
+    trimmed = []
+    previous_ai_content = None
+    for i, message in enumerate(messages):
+        if getattr(message, "name", None) == _TOOL_RESULT_NAME:
+            if i not in recent_results and len(message.content) > _TRUNCATED_RESULT_CHARS:
+                # copy() keeps the message type and, for a ToolMessage, its tool_call_id
+                message = message.copy(update={
+                    "content": message.content[:_TRUNCATED_RESULT_CHARS] + "... [truncated]"
+                })
+        elif isinstance(message, AIMessage) and not message.tool_calls:
+            if message.content == previous_ai_content:
+                continue
+            previous_ai_content = message.content
+        trimmed.append(message)
     
-    SYSTEM_PROMPT = """
-You are a helpful Kubernetes cluster information assistant. You can help users get information about their Kubernetes cluster by answering questions in natural language.
+    return trimmed
 
-You have access to these tools:
-- list_namespaces: Get all namespaces in the cluster
-- list_pods: Get pods, optionally filtered by namespace  
-- list_nodes: Get all nodes in the cluster
-- list_services: Get services, optionally filtered by namespace
-- get_cluster_info: Get general cluster overview and statistics
 
-To use a tool, respond with JSON in this format:
-{"tool": "tool_name", "parameters": {"param": "value"}}
+def _cacheable_system_blocks(prompt: str, converse: bool) -> List[Dict[str, Any]]:
+    """System prompt content blocks carrying a prompt cache checkpoint."""
+    if converse:
+        # Converse API expects an explicit cache checkpoint block after the cached content
+        return [
+            {"type": "text", "text": prompt},
+            {"cachePoint": {"type": "default"}}
+        ]
+    return [
+        {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}
+    ]
 
-Guidelines:
-1. Be conversational and helpful
-2. Use the appropriate tool based on the user's question
-3. Format responses clearly using markdown
-4. If a user asks a vague question, use get_cluster_info for an overview
-5. For specific questions about pods, nodes, namespaces, or services, use the specific tools
-6. Always provide context and explain what the information means
-7. If there are issues or no resources found, explain this clearly
 
+class KubernetesGraphAgent:
+    """LangGraph-based Kubernetes assistant."""
+    
+    # Kept short: it is resent on every turn. Static content only, so it caches well.
+    SYSTEM_PROMPT = """You are a Kubernetes cluster information assistant. Answer questions about the user's cluster with these read-only tools:
+- list_namespaces
+- list_pods (optional "namespace")
+- list_nodes
+- list_services (optional "namespace")
+- get_cluster_info: overview and counts
+
+Use get_cluster_info for vague questions. Format answers in markdown, explain what the data means, and say clearly when nothing was found.
+"""
+    
+    # How to request tools: models with native tool calling get the tool schemas
+    # through the API; the rest use a JSON text protocol parsed by _parse_tool_calls
+    NATIVE_TOOLS_PROMPT = """When several independent tools are needed, call them together in one turn.
+"""
+    JSON_TOOLS_PROMPT = """To use a tool, respond with JSON: {"tool": "tool_name", "parameters": {"param": "value"}}
+For several independent tools, respond with a JSON array of these objects.
+"""
+    
+    # Optional few-shot block, appended only when few_shot=True
+    FEW_SHOT_EXAMPLES = """
 Example interactions:
 - "How many pods are running?" → Use get_cluster_info or list_pods
 - "List all namespaces" → Use list_namespaces
@@ -51,92 +157,193 @@ Example interactions:
 - "Are all nodes ready?" → Use list_nodes
 """
     
-    def __init__(self, model_name: str = "claude-3-haiku", region: str = None):
+    # Seconds a cached response stays valid for identical queries, and how many are kept
+    RESPONSE_CACHE_TTL = 60
+    RESPONSE_CACHE_SIZE = 128
+    
+    # The graph topology is the same for every agent, so it is compiled once per
+    # process; nodes reach the owning agent through state["agent"]
+    _compiled_graph: ClassVar[Any] = None
+    _graph_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, model_name: str = "claude-3-haiku", region: str = None, few_shot: bool = False):
         """Initialize the LangGraph agent."""
         self.model_name = model_name
         self.region = region
+        self._few_shot = few_shot
         
         # Initialize components
         self.bedrock_llm = create_bedrock_llm(model_name, region)
         self.llm = self.bedrock_llm.get_llm()
         
+        # The mock LLM never emits tool calls, so queries can skip the graph entirely
+        self._fast_mock = isinstance(self.llm, MockLLM)
+        
         # Initialize K8s client
-        initialize_k8s_client()
+        k8s_client = initialize_k8s_client()
+        
+        # Claude 3 models take the tool schemas natively and can request several
+        # tools in one turn; the LangChain tools only supply the schemas, calls
+        # still run through AVAILABLE_TOOLS
+        self._native_tools = self.bedrock_llm.supports_tool_calling()
+        if self._native_tools:
+            from tools.k8s_tools import get_kubernetes_tools
+            self.llm = self.llm.bind_tools(get_kubernetes_tools(k8s_client), tool_choice="auto")
+        
+        self._system_message = self._build_system_message(self.bedrock_llm, few_shot)
         
-        # Build the graph
-        self.graph = self._build_graph()
+        # Build the graph (shared across instances)
+        self.graph = self._get_graph()
+        
+        # Per-instance LRU response cache, keyed by (user_input, TTL bucket); shared by
+        # query() and query_stream(), so it is a locked OrderedDict rather than lru_cache
+        self._responses: "OrderedDict[tuple, str]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+        
+        # Built by get_agent_info() on first call; the configuration never changes
+        self._info_cache: Optional[Dict[str, Any]] = None
         
         logger.info("LangGraph Kubernetes agent initialized successfully")
     
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph state graph."""
+    @classmethod
+    def _build_system_message(cls, bedrock_llm, few_shot: bool = False) -> SystemMessage:
+        """Build the system message, marking it cacheable when the model supports prompt caching."""
+        native_tools = bedrock_llm.supports_tool_calling()
+        prompt = cls.SYSTEM_PROMPT + (cls.NATIVE_TOOLS_PROMPT if native_tools else cls.JSON_TOOLS_PROMPT)
+        if few_shot:
+            prompt += cls.FEW_SHOT_EXAMPLES
+        if not bedrock_llm.supports_prompt_caching():
+            return SystemMessage(content=prompt)
+        return SystemMessage(content=_cacheable_system_blocks(prompt, bedrock_llm.uses_latency_optimized()))
+    
+    def _agent_node(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Main agent reasoning node."""
+        messages = state.get("messages", [])
         
-        def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
-            """Main agent reasoning node."""
-            messages = state.get("messages", [])
-            
-            # Add system message if not present
-            if not any(isinstance(msg, SystemMessage) for msg in messages):
-                messages = [SystemMessage(content=self.SYSTEM_PROMPT)] + messages
-            
-            # Get LLM response
+        # Add system message once per conversation
+        if not state.get("system_injected"):
+            messages.insert(0, self._system_message)
+            state["system_injected"] = True
+        else:
+            messages = _trim_messages(messages)
+        
+        # Get LLM response, streaming it out when a stream sink is attached
+        # (LLMs without .stream fall back to a single chunk at the end)
+        sink = state.get("stream_sink")
+        if sink is not None and hasattr(self.llm, "stream"):
+            response = self._stream_llm(messages, state)
+        else:
             response = self.llm.invoke(messages)
-            
-            # Check if response contains tool call
-            tool_call = self._parse_tool_call(response.content)
-            
-            if tool_call:
-                state["tool_call"] = tool_call
-                state["messages"] = messages + [response]
-                return state
-            else:
-                # Final response
-                state["messages"] = messages + [response]
-                state["final_response"] = response.content
-                return state
         
-        def tool_node(state: Dict[str, Any]) -> Dict[str, Any]:
-            """Execute tool and return result."""
-            tool_call = state.get("tool_call")
-            
-            if not tool_call:
-                return state
-            
-            tool_name = tool_call["tool"]
-            parameters = tool_call.get("parameters", {})
-            
-            # Execute tool
-            if tool_name in AVAILABLE_TOOLS:
-                try:
-                    tool_func = AVAILABLE_TOOLS[tool_name]["function"]
-                    if parameters:
-                        result = tool_func(**parameters)
-                    else:
-                        result = tool_func()
-                    
-                    # Add tool result to messages
-                    tool_message = AIMessage(content=f"Tool {tool_name} result: {result}")
-                    state["messages"].append(tool_message)
-                    
-                except Exception as e:
-                    error_message = AIMessage(content=f"Error executing {tool_name}: {str(e)}")
-                    state["messages"].append(error_message)
-            else:
-                error_message = AIMessage(content=f"Unknown tool: {tool_name}")
-                state["messages"].append(error_message)
-            
-            # Clear tool call
-            state["tool_call"] = None
+        # Check if response contains tool calls
+        content = _content_text(response.content)
+        tool_calls = self._response_tool_calls(response, content)
+        
+        messages.append(response)
+        state["messages"] = messages
+        
+        if tool_calls:
+            state["tool_calls"] = tool_calls
+        else:
+            # Final response
+            state["final_response"] = content
+        return state
+    
+    def _stream_llm(self, messages: List[Any], state: Dict[str, Any]):
+        """
+        Stream an LLM response into state["stream_sink"] and return the full message.
+        
+        Text is forwarded as it arrives until the first "{" or "["; anything after it is
+        held back until the response is complete, so tool-call JSON never reaches the user.
+        """
+        sink = state["stream_sink"]
+        response = None
+        text = ""
+        emitted = 0
+        holding = False
+        
+        for chunk in self.llm.stream(messages):
+            response = chunk if response is None else response + chunk
+            delta = _content_text(chunk.content)
+            if not delta:
+                continue
+            text += delta
+            if holding:
+                continue
+            # Native tool calls arrive as separate content blocks, so only the JSON
+            # protocol needs the text held back
+            json_start = None if self._native_tools else _TOOL_JSON_START.search(delta)
+            if json_start:
+                holding = True
+                delta = delta[:json_start.start()]
+            if delta:
+                sink.put(delta)
+                emitted += len(delta)
+        
+        if emitted:
+            state["streamed"] = True
+        
+        if self._response_tool_calls(response, text):
+            # Separate any preamble from the answer that follows the tool results
+            if emitted:
+                sink.put("\n\n")
+        elif emitted < len(text):
+            sink.put(text[emitted:])
+            state["streamed"] = True
+        
+        return response
+    
+    def _tool_node(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the pending tool calls and return their results."""
+        tool_calls = state.get("tool_calls")
+        
+        if not tool_calls:
             return state
         
+        # Tools are independent, sync kubernetes calls; run them in parallel threads
+        if len(tool_calls) == 1:
+            results = [self._execute_tool(tool_calls[0])]
+        else:
+            results = list(_TOOL_EXECUTOR.map(self._execute_tool, tool_calls))
+        
+        # Add tool results to messages
+        if "id" in tool_calls[0]:
+            # Native calls: one ToolMessage per call, in the order the model made them;
+            # consecutive ToolMessages are sent back together in a single user turn
+            state["messages"].extend(
+                ToolMessage(content=result, tool_call_id=tool_call["id"], name=_TOOL_RESULT_NAME)
+                for tool_call, result in zip(tool_calls, results)
+            )
+        else:
+            state["messages"].append(AIMessage(content="\n\n".join(results), name=_TOOL_RESULT_NAME))
+        
+        # Clear tool calls
+        state["tool_calls"] = None
+        return state
+    
+    @classmethod
+    def _get_graph(cls):
+        """Return the process-wide compiled graph, building it on first use."""
+        if cls._compiled_graph is None:
+            with cls._graph_lock:
+                if cls._compiled_graph is None:
+                    cls._compiled_graph = cls._build_graph()
+        return cls._compiled_graph
+    
+    @staticmethod
+    def _build_graph():
+        """Build and compile the LangGraph state graph."""
+        from langgraph.graph import StateGraph, END
+        
+        def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            return state["agent"]._agent_node(state)
+        
+        def tool_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            return state["agent"]._tool_node(state)
+        
         def should_continue(state: Dict[str, Any]) -> str:
-            """Decide whether to continue or end."""
-            if state.get("tool_call"):
-                return "tool"
-            elif state.get("final_response"):
-                return END
-            else:
-                return "agent"
+            """Run pending tool calls, otherwise end (agent_node always sets one or the other)."""
+            return "tool" if state.get("tool_calls") else END
         
         # Build graph
         workflow = StateGraph(dict)
@@ -151,59 +358,188 @@ Example interactions:
             should_continue,
             {
                 "tool": "tool",
-                END: END,
-                "agent": "agent"
+                END: END
             }
         )
         
         workflow.add_edge("tool", "agent")
         
-        return workflow.compile()
+        # Debug mode prints every step and state to stdout; keep it off unless asked for
+        verbose = os.getenv("LANGCHAIN_VERBOSE", "false").lower() == "true"
+        return workflow.compile(debug=verbose)
+    
+    def _response_tool_calls(self, response, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Tool calls requested by an LLM response: native tool calls, or JSON in its text."""
+        if not self._native_tools:
+            return self._parse_tool_calls(text)
+        
+        # Native calls keep their id so each result can be answered with a matching ToolMessage
+        tool_calls = [
+            {"tool": call["name"], "parameters": call["args"], "id": call["id"]}
+            for call in getattr(response, "tool_calls", None) or []
+        ]
+        return tool_calls or None
+    
+    def _parse_tool_calls(self, response: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse one or more tool calls (a single object or a JSON array) from LLM response."""
+        # Cheap substring check first; most final answers contain no tool call
+        if '"tool"' not in response:
+            return None
+        
+        # Each top-level object is a candidate, including the elements of a JSON array;
+        # parameters may be nested objects
+        tool_calls = []
+        for candidate in _iter_json_objects(response):
+            if '"tool"' not in candidate:
+                continue
+            try:
+                tool_call = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(tool_call, dict) and "tool" in tool_call:
+                tool_calls.append(tool_call)
+        
+        return tool_calls or None
     
-    def _parse_tool_call(self, response: str) -> Dict[str, Any]:
-        """Parse tool call from LLM response."""
+    def _execute_tool(self, tool_call: Dict[str, Any]) -> str:
+        """Execute a single tool call and return the message text for its result."""
+        tool_name = tool_call["tool"]
+        parameters = tool_call.get("parameters") or {}
+        
+        if tool_name not in AVAILABLE_TOOLS:
+            return f"Unknown tool: {tool_name}"
+        
         try:
-            # Look for JSON in the response
-            json_match = re.search(r'\{[^}]*"tool"[^}]*\}', response)
-            if json_match:
-                tool_call = json.loads(json_match.group())
-                if "tool" in tool_call:
-                    return tool_call
-        except json.JSONDecodeError:
-            pass
+            tool_func = AVAILABLE_TOOLS[tool_name]["function"]
+            result = tool_func(**parameters)
+            return f"Tool {tool_name} result: {result}"
+        except Exception as e:
+            return f"Error executing {tool_name}: {str(e)}"
+    
+    def _initial_state(self, user_input: str) -> Dict[str, Any]:
+        """Build the graph input state for a query."""
+        return {
+            "agent": self,
+            "messages": [HumanMessage(content=user_input)],
+            "tool_calls": None,
+            "final_response": None,
+            "system_injected": False
+        }
+    
+    def _extract_response(self, final_state: Dict[str, Any]) -> str:
+        """Pick the answer out of a finished graph state."""
+        if final_state.get("final_response"):
+            return final_state["final_response"]
+        elif final_state.get("messages"):
+            # Get last AI message
+            for msg in reversed(final_state["messages"]):
+                if isinstance(msg, AIMessage):
+                    return _content_text(msg.content)
+        
+        return "I couldn't process your request."
+    
+    def _cache_key(self, user_input: str) -> tuple:
+        """Response cache key; the time bucket expires entries after RESPONSE_CACHE_TTL."""
+        return user_input, int(time.time() // self.RESPONSE_CACHE_TTL)
+    
+    def cached_response(self, user_input: str) -> Optional[str]:
+        """The cached answer to an identical recent query, or None."""
+        return self._lookup_response(self._cache_key(user_input))
+    
+    def _lookup_response(self, key: tuple) -> Optional[str]:
+        """Get a cached answer by key, marking it recently used."""
+        with self._responses_lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+        return response
+    
+    def _store_response(self, key: tuple, response: str):
+        """Cache a completed answer, evicting the least recently used beyond RESPONSE_CACHE_SIZE."""
+        with self._responses_lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            if len(self._responses) > self.RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+    
+    def _answer_chunks(self, user_input: str) -> Iterator[str]:
+        """Yield the answer as it is produced (a cache hit is a single chunk), caching it once complete."""
+        if self._fast_mock:
+            yield self.llm.invoke(user_input)
+            return
         
-        return None
+        key = self._cache_key(user_input)
+        cached = self._lookup_response(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        for chunk in self._run_graph_stream(user_input):
+            chunks.append(chunk)
+            yield chunk
+        self._store_response(key, "".join(chunks))
+    
+    def _run_graph_stream(self, user_input: str) -> Iterator[str]:
+        """Run the graph for a query, yielding answer text as the LLM produces it."""
+        sink = queue.Queue()
+        state = self._initial_state(user_input)
+        state["stream_sink"] = sink
+        
+        def run():
+            try:
+                final_state = self.graph.invoke(state)
+                if not final_state.get("streamed"):
+                    sink.put(self._extract_response(final_state))
+            except Exception as e:
+                sink.put(e)
+            finally:
+                sink.put(_STREAM_END)
+        
+        # The graph is synchronous, so it runs in a worker while we drain the queue
+        threading.Thread(target=run, name="agent-stream", daemon=True).start()
+        
+        while True:
+            item = sink.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    
+    def query_stream(self, user_input: str) -> Iterator[str]:
+        """
+        Process a user query, yielding the answer text as the LLM produces it.
+        Identical queries are served from cache for RESPONSE_CACHE_TTL seconds.
+        """
+        logger.info("Streaming query: %s", user_input)
+        yield from self._answer_chunks(user_input)
     
     def query(self, user_input: str) -> str:
-        """Process a user query."""
+        """Process a user query. Identical queries are served from cache for RESPONSE_CACHE_TTL seconds."""
         try:
-            logger.info(f"Processing query: {user_input}")
-            
-            # Initialize state
-            initial_state = {
-                "messages": [HumanMessage(content=user_input)],
-                "tool_call": None,
-                "final_response": None
-            }
-            
-            # Run the graph
-            final_state = self.graph.invoke(initial_state)
-            
-            # Extract final response
-            if final_state.get("final_response"):
-                return final_state["final_response"]
-            elif final_state.get("messages"):
-                # Get last AI message
-                for msg in reversed(final_state["messages"]):
-                    if isinstance(msg, AIMessage):
-                        return msg.content
-            
-            return "I couldn't process your request."
+            logger.info("Processing query: %s", user_input)
+            return "".join(self._answer_chunks(user_input))
             
         except Exception as e:
-            logger.error(f"Error processing query: {e}")
+            logger.error("Error processing query: %s", e)
             return f"I encountered an error while processing your request: {str(e)}"
     
+    def get_agent_info(self) -> Dict[str, Any]:
+        """Get the agent configuration (model, region, tools), built once and reused."""
+        if self._info_cache is None:
+            self._info_cache = {
+                "model_info": self.bedrock_llm.get_model_info(),
+                "region": self.bedrock_llm.region,
+                "available_tools": list(AVAILABLE_TOOLS),
+                "native_tool_calling": self._native_tools
+            }
+        return self._info_cache
+    
+    def clear_agent_info_cache(self):
+        """Drop the memoized get_agent_info() result."""
+        self._info_cache = None
+    
     def get_available_commands(self) -> List[str]:
         """Get example commands."""
         return [
@@ -225,11 +561,17 @@ Example interactions:
             response = self.query("What's the cluster overview?")
             return "error" not in response.lower()
         except Exception as e:
-            logger.error(f"Agent test failed: {e}")
+            logger.error("Agent test failed: %s", e)
             return False
 
 
+@functools.lru_cache(maxsize=4)
+def _get_agent_singleton(model_name: str, region: str) -> KubernetesGraphAgent:
+    """Return a process-wide agent per model/region so clients and the compiled graph are reused."""
+    return KubernetesGraphAgent(model_name=model_name, region=region)
+
+
 def create_kubernetes_agent(model_name: str = None, region: str = None) -> KubernetesGraphAgent:
-    """Factory function to create a LangGraph Kubernetes agent."""
+    """Factory function to create (or reuse) a LangGraph Kubernetes agent."""
     model_name = model_name or "claude-3-haiku"
-    return KubernetesGraphAgent(model_name=model_name, region=region)
+    return _get_agent_singleton(model_name, region)
@@ -4,13 +4,11 @@ Handles model initialization, configuration, and response generation.
 Supports mock mode for frontend/CLI testing without AWS access.
 """
 
-import boto3
-from langchain_aws import ChatBedrock
-from botocore.exceptions import ClientError, NoCredentialsError
+import functools
 import logging
 import os
+from types import MappingProxyType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class MockLLM:
@@ -21,26 +19,45 @@ class MockLLM:
 class BedrockLLM:
     """AWS Bedrock LLM wrapper for cluster information queries. Supports mock mode."""
     
-    # Available models with their configurations
-    AVAILABLE_MODELS = {
+    # Available models with their configurations. Read-only at both levels: the per-model
+    # mappings are shared across threads through model_config and list_available_models()
+    AVAILABLE_MODELS = MappingProxyType({name: MappingProxyType(config) for name, config in {
         "claude-3-sonnet": {
             "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
             "max_tokens": 4096,
-            "temperature": 0.1
+            "temperature": 0.1,
+            "tool_calling": True
         },
         "claude-3-haiku": {
             "model_id": "anthropic.claude-3-haiku-20240307-v1:0",
             "max_tokens": 4096,
-            "temperature": 0.1
+            "temperature": 0.1,
+            "tool_calling": True
+        },
+        "claude-3-5-haiku": {
+            "model_id": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+            "max_tokens": 4096,
+            "temperature": 0.1,
+            "latency": "optimized",
+            "prompt_caching": True,
+            "tool_calling": True
+        },
+        "llama3-1-70b": {
+            "model_id": "us.meta.llama3-1-70b-instruct-v1:0",
+            "max_tokens": 2048,
+            "temperature": 0.1,
+            "latency": "optimized"
         },
         "titan-text": {
             "model_id": "amazon.titan-text-express-v1",
             "max_tokens": 4096,
             "temperature": 0.1
         }
-    }
+    }.items()})
+    _AVAILABLE_KEYS = tuple(AVAILABLE_MODELS)
     
-    def __init__(self, model_name: str = "claude-3-haiku", region: str = None, mock_mode: bool = None):
+    def __init__(self, model_name: str = "claude-3-haiku", region: str = None, mock_mode: bool = None,
+                 latency_optimized: bool = None):
         """
         Initialize Bedrock LLM (or mock LLM if mock_mode is enabled).
         
@@ -48,13 +65,18 @@ class BedrockLLM:
             model_name: Name of the model to use (from AVAILABLE_MODELS)
             region: AWS region for Bedrock service
             mock_mode: If True, use mock LLM for testing (set via env BEDROCK_MOCK_MODE)
+            latency_optimized: If True, request latency-optimized inference for models
+                that support it (set via env BEDROCK_LATENCY_OPTIMIZED=1)
         """
         self.model_name = model_name
         self.region = region or os.getenv("AWS_REGION", "us-west-2")
         self.mock_mode = mock_mode if mock_mode is not None else os.getenv("BEDROCK_MOCK_MODE", "false").lower() == "true"
+        if latency_optimized is None:
+            latency_optimized = os.getenv("BEDROCK_LATENCY_OPTIMIZED", "0") == "1"
+        self.latency_optimized = latency_optimized
         
         if model_name not in self.AVAILABLE_MODELS:
-            raise ValueError(f"Model {model_name} not supported. Available: {list(self.AVAILABLE_MODELS.keys())}")
+            raise ValueError(f"Model {model_name} not supported. Available: {list(self._AVAILABLE_KEYS)}")
         
         self.model_config = self.AVAILABLE_MODELS[model_name]
         self.llm = None
@@ -71,37 +93,46 @@ class BedrockLLM:
     
     def _initialize_bedrock(self):
         """Initialize the Bedrock client and LLM."""
+        # Imported here so mock mode and model listing don't load boto3/langchain
+        import boto3
+        from botocore.config import Config
+        from botocore.exceptions import ClientError
+        from langchain_aws import ChatBedrock, ChatBedrockConverse
+        
         try:
-            # Test AWS credentials
-            session = boto3.Session()
-            credentials = session.get_credentials()
-            
-            if not credentials:
-                raise NoCredentialsError()
-            
-            # Initialize Bedrock client
+            # Initialize Bedrock client; credential problems surface on the first
+            # invocation (see test_connection) instead of via a separate Session lookup
             self.bedrock_client = boto3.client(
                 service_name='bedrock-runtime',
-                region_name=self.region
+                region_name=self.region,
+                config=Config(max_pool_connections=50, retries={"mode": "adaptive"})
             )
             # Instead of list_foundation_models, do a simple model invocation for connection test
             # This will be handled in test_connection()
             
-            # Initialize LangChain ChatBedrock
-            self.llm = ChatBedrock(
-                client=self.bedrock_client,
-                model_id=self.model_config["model_id"],
-                model_kwargs={
-                    "max_tokens": self.model_config["max_tokens"],
-                    "temperature": self.model_config["temperature"]
-                }
-            )
+            if self.uses_latency_optimized():
+                # Latency-optimized inference is only exposed through the Converse API
+                self.llm = ChatBedrockConverse(
+                    client=self.bedrock_client,
+                    model=self.model_config["model_id"],
+                    max_tokens=self.model_config["max_tokens"],
+                    temperature=self.model_config["temperature"],
+                    performance_config={"latency": self.model_config["latency"]}
+                )
+            else:
+                # Initialize LangChain ChatBedrock
+                self.llm = ChatBedrock(
+                    client=self.bedrock_client,
+                    model_id=self.model_config["model_id"],
+                    model_kwargs={
+                        "max_tokens": self.model_config["max_tokens"],
+                        "temperature": self.model_config["temperature"]
+                    }
+                )
             
-            logger.info(f"Initialized Bedrock LLM with model: {self.model_name} in region: {self.region}")
+            logger.info("Initialized Bedrock LLM with model: %s in region: %s%s", self.model_name, self.region,
+                        " (latency optimized)" if self.uses_latency_optimized() else "")
             
-        except NoCredentialsError:
-            logger.error("AWS credentials not found. Please configure using 'aws configure' or environment variables.")
-            raise
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'UnauthorizedOperation':
@@ -109,12 +140,24 @@ class BedrockLLM:
             elif error_code == 'AccessDenied':
                 logger.error("Access denied to Bedrock service. Please check your permissions.")
             else:
-                logger.error(f"AWS Client Error: {e}")
+                logger.error("AWS Client Error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error initializing Bedrock: {e}")
+            logger.error("Error initializing Bedrock: %s", e)
             raise
     
+    def uses_latency_optimized(self) -> bool:
+        """Whether latency-optimized inference is enabled and supported by the current model."""
+        return self.latency_optimized and self.model_config.get("latency") == "optimized"
+    
+    def supports_prompt_caching(self) -> bool:
+        """Whether the current model accepts prompt cache checkpoints (never in mock mode)."""
+        return not self.mock_mode and self.model_config.get("prompt_caching", False)
+    
+    def supports_tool_calling(self) -> bool:
+        """Whether the current model accepts native tool definitions (never in mock mode)."""
+        return not self.mock_mode and self.model_config.get("tool_calling", False)
+    
     def get_llm(self):
         """Get the initialized LLM instance (mock or real)."""
         if not self.llm:
@@ -139,12 +182,12 @@ class BedrockLLM:
             logger.info("Bedrock connection test successful")
             return True
         except Exception as e:
-            logger.error(f"Bedrock connection test failed: {e}")
+            logger.error("Bedrock connection test failed: %s", e)
             return False
     
     @classmethod
-    def list_available_models(cls) -> dict:
-        """List all available models and their configurations."""
+    def list_available_models(cls) -> MappingProxyType:
+        """List all available models and their configurations (read-only view)."""
         return cls.AVAILABLE_MODELS
     
     def get_model_info(self) -> dict:
@@ -154,11 +197,20 @@ class BedrockLLM:
             "model_id": self.model_config["model_id"],
             "region": self.region,
             "max_tokens": self.model_config["max_tokens"],
-            "temperature": self.model_config["temperature"]
+            "temperature": self.model_config["temperature"],
+            "latency_optimized": self.uses_latency_optimized()
         }
 
 
-def create_bedrock_llm(model_name: str = None, region: str = None, mock_mode: bool = None) -> BedrockLLM:
+@functools.lru_cache(maxsize=4)
+def _get_bedrock_singleton(model_name: str, region: str, mock_mode: bool, latency_optimized: bool) -> BedrockLLM:
+    """Return a process-wide BedrockLLM per configuration so the boto3 connection pool is reused."""
+    return BedrockLLM(model_name=model_name, region=region, mock_mode=mock_mode,
+                      latency_optimized=latency_optimized)
+
+
+def create_bedrock_llm(model_name: str = None, region: str = None, mock_mode: bool = None,
+                       latency_optimized: bool = None) -> BedrockLLM:
     """
     Factory function to create a BedrockLLM instance (supports mock mode).
     
@@ -166,12 +218,16 @@ def create_bedrock_llm(model_name: str = None, region: str = None, mock_mode: bo
         model_name: Model to use (defaults to environment variable or claude-3-haiku)
         region: AWS region (defaults to environment variable or us-west-2)
         mock_mode: If True, use mock LLM for testing (set via env BEDROCK_MOCK_MODE)
+        latency_optimized: If True, use latency-optimized inference where supported
+            (set via env BEDROCK_LATENCY_OPTIMIZED=1)
     
     Returns:
-        Initialized BedrockLLM instance
+        Initialized BedrockLLM instance, shared between callers with the same configuration
     """
     model_name = model_name or os.getenv("BEDROCK_MODEL_NAME", "claude-3-haiku")
     region = region or os.getenv("AWS_REGION", "us-west-2")
     if mock_mode is None:
         mock_mode = os.getenv("BEDROCK_MOCK_MODE", "false").lower() == "true"
-    return BedrockLLM(model_name=model_name, region=region, mock_mode=mock_mode)
+    if latency_optimized is None:
+        latency_optimized = os.getenv("BEDROCK_LATENCY_OPTIMIZED", "0") == "1"
+    return _get_bedrock_singleton(model_name, region, mock_mode, latency_optimized)
@@ -3,9 +3,12 @@ Simple script to check Python environment and dependencies.
 Run this to see what's installed and what needs to be installed.
 """
 
+import functools
 import sys
 import subprocess
+import importlib.metadata
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 def check_python():
     """Check Python version."""
@@ -13,16 +16,48 @@ def check_python():
     print(f"📍 Python executable: {sys.executable}")
     print()
 
+# Required packages (import names)
+REQUIRED_PACKAGES = (
+    'boto3',
+    'kubernetes',
+    'langchain',
+    'langchain_aws',
+    'langchain_community',
+    'pydantic',
+    'dotenv',
+    'yaml',
+    'click',
+    'rich',
+    'tabulate',
+    'flask',
+    'flask_cors',
+    'flask_compress',
+    'orjson'
+)
+
+# Import name -> distribution name, where they differ
+DISTRIBUTION_NAMES = {
+    'langchain_aws': 'langchain-aws',
+    'langchain_community': 'langchain-community',
+    'dotenv': 'python-dotenv',
+    'yaml': 'PyYAML',
+    'flask_cors': 'Flask-Cors',
+    'flask_compress': 'Flask-Compress'
+}
+
+# Lookups walk sys.path, so each package is only resolved once per process
+_find_spec_cached = functools.lru_cache(maxsize=None)(importlib.util.find_spec)
+_version_cached = functools.lru_cache(maxsize=None)(importlib.metadata.version)
+
 def check_package(package_name):
-    """Check if a package is installed."""
-    spec = importlib.util.find_spec(package_name)
+    """Check if a package is installed (without importing it)."""
+    spec = _find_spec_cached(package_name)
     if spec is not None:
         try:
-            module = importlib.import_module(package_name)
-            version = getattr(module, '__version__', 'Unknown version')
-            return f"✅ {package_name}: {version}"
-        except ImportError:
-            return f"⚠️  {package_name}: Found but can't import"
+            version = _version_cached(DISTRIBUTION_NAMES.get(package_name, package_name))
+        except importlib.metadata.PackageNotFoundError:
+            version = 'Unknown version'
+        return f"✅ {package_name}: {version}"
     else:
         return f"❌ {package_name}: Not installed"
 
@@ -35,21 +70,7 @@ def main():
     check_python()
     
     # Required packages
-    packages = [
-        'boto3',
-        'kubernetes',
-        'langchain',
-        'langchain_aws',
-        'langchain_community', 
-        'pydantic',
-        'dotenv',
-        'yaml',
-        'click',
-        'rich',
-        'tabulate',
-        'flask',
-        'flask_cors'
-    ]
+    packages = REQUIRED_PACKAGES
     
     print("📦 Package Status:")
     print("-" * 40)
@@ -57,8 +78,11 @@ def main():
     installed = 0
     total = len(packages)
     
-    for package in packages:
-        status = check_package(package)
+    # Lookups are independent filesystem I/O; map() keeps results in list order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(check_package, packages))
+    
+    for status in statuses:
         print(status)
         if "✅" in status:
             installed += 1
@@ -18,34 +18,38 @@ from agent import create_kubernetes_agent
 console = Console()
 
 
+# Predefined demo queries to showcase capabilities
+DEMO_QUERIES = (
+    {
+        "query": "What's the cluster overview?",
+        "description": "Get general cluster information and statistics"
+    },
+    {
+        "query": "List all namespaces",
+        "description": "Show all namespaces in the cluster"
+    },
+    {
+        "query": "How many pods are running?",
+        "description": "Count running pods across all namespaces"
+    },
+    {
+        "query": "Show me the nodes in the cluster",
+        "description": "Display node information and status"
+    },
+    {
+        "query": "List pods in the kube-system namespace",
+        "description": "Show system pods in the kube-system namespace"
+    },
+    {
+        "query": "What services are exposed?",
+        "description": "Display all services across namespaces"
+    }
+)
+
+
 def demo_queries():
     """Predefined demo queries to showcase capabilities."""
-    return [
-        {
-            "query": "What's the cluster overview?",
-            "description": "Get general cluster information and statistics"
-        },
-        {
-            "query": "List all namespaces",
-            "description": "Show all namespaces in the cluster"
-        },
-        {
-            "query": "How many pods are running?",
-            "description": "Count running pods across all namespaces"
-        },
-        {
-            "query": "Show me the nodes in the cluster",
-            "description": "Display node information and status"
-        },
-        {
-            "query": "List pods in the kube-system namespace",
-            "description": "Show system pods in the kube-system namespace"
-        },
-        {
-            "query": "What services are exposed?",
-            "description": "Display all services across namespaces"
-        }
-    ]
+    return DEMO_QUERIES
 
 
 def run_demo():
@@ -62,6 +66,7 @@ def run_demo():
         # Initialize agent
         console.print("🤖 Initializing the Kubernetes agent...", style="blue")
         
+        # One Progress (and render thread) for the whole demo; tasks come and go per step
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -69,62 +74,57 @@ def run_demo():
         ) as progress:
             task = progress.add_task("Setting up agent...", total=None)
             agent = create_kubernetes_agent()
-            progress.update(task, description="Agent ready!")
-        
-        console.print("✅ Agent initialized successfully!", style="green")
-        console.print()
-        
-        # Show agent info
-        agent_info = agent.get_agent_info()
-        info_panel = Panel(
-            f"Model: {agent_info['model_info']['model_id']}\n"
-            f"Region: {agent_info['region']}\n"
-            f"Available Tools: {', '.join(agent_info['available_tools'])}",
-            title="Agent Configuration",
-            style="cyan"
-        )
-        console.print(info_panel)
-        console.print()
-        
-        # Run demo queries
-        queries = demo_queries()
-        
-        for i, demo in enumerate(queries, 1):
-            console.print(f"🔍 Demo Query {i}/{len(queries)}", style="bold yellow")
-            console.print(f"Description: {demo['description']}", style="dim")
+            progress.remove_task(task)
             
-            # Show the query
-            query_panel = Panel(
-                demo['query'],
-                title="User Query",
-                style="blue"
-            )
-            console.print(query_panel)
-            
-            # Execute query with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Processing query...", total=None)
-                response = agent.query(demo['query'])
-                progress.update(task, description="Complete!")
+            console.print("✅ Agent initialized successfully!", style="green")
+            console.print()
             
-            # Show response
-            response_panel = Panel(
-                response,
-                title="Agent Response",
-                style="green"
+            # Show agent info
+            agent_info = agent.get_agent_info()
+            info_panel = Panel(
+                f"Model: {agent_info['model_info']['model_id']}\n"
+                f"Region: {agent_info['region']}\n"
+                f"Available Tools: {', '.join(agent_info['available_tools'])}",
+                title="Agent Configuration",
+                style="cyan"
             )
-            console.print(response_panel)
+            console.print(info_panel)
             console.print()
             
-            # Pause between queries (except for the last one)
-            if i < len(queries):
-                console.print("⏳ Moving to next query in 3 seconds...", style="dim")
-                time.sleep(3)
+            # Run demo queries
+            queries = demo_queries()
+            
+            for i, demo in enumerate(queries, 1):
+                console.print(f"🔍 Demo Query {i}/{len(queries)}", style="bold yellow")
+                console.print(f"Description: {demo['description']}", style="dim")
+                
+                # Show the query
+                query_panel = Panel(
+                    demo['query'],
+                    title="User Query",
+                    style="blue"
+                )
+                console.print(query_panel)
+                
+                # Execute query with progress
+                task = progress.add_task("Processing query...", total=None)
+                response = agent.query(demo['query'])
+                progress.remove_task(task)
+                
+                # Show response
+                response_panel = Panel(
+                    response,
+                    title="Agent Response",
+                    style="green"
+                )
+                console.print(response_panel)
                 console.print()
+                
+                # Pause between queries (except for the last one); DEMO_FAST=1 skips it for CI and profiling
+                if i < len(queries) and os.environ.get("DEMO_FAST") != "1":
+                    console.print("⏳ Moving to next query in 3 seconds...", style="dim")
+                    time.sleep(3)
+                    console.print()
         
         # Demo completion
         completion_panel = Panel(
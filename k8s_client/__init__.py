@@ -5,18 +5,98 @@ Provides functions to query pods, namespaces, nodes, and services.
 
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
-from typing import List, Dict, Any, Optional
+import orjson
+from typing import List, Dict, Any, Optional, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import functools
 import logging
+import os
+import threading
+import time
+
+from .cache import ClusterStateCache
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Asks the API server for metadata-only lists (no spec/status), which are far smaller
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+# Label prefix marking a node's roles, e.g. node-role.kubernetes.io/control-plane
+NODE_ROLE_PREFIX = "node-role.kubernetes.io/"
+NODE_ROLE_PREFIX_LEN = len(NODE_ROLE_PREFIX)
+
+# Debug switch: build list results from the client's generated models instead of raw JSON
+LEGACY_DESERIALIZE = os.getenv("K8S_LEGACY_DESERIALIZE", "false").lower() == "true"
+
+
+def ttl_cached(ttl_seconds: float):
+    """
+    Cache a KubernetesClient method's result per (method, arguments) for ttl_seconds.
+    
+    The wrapped method accepts force_refresh=True to bypass the cache. If the API
+    call fails with an ApiException, the last cached value (however old) is
+    returned instead, with a warning. Caching is skipped while the watch-fed
+    state cache is serving reads, since that is already current.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+            if self.state_cache is not None and self.state_cache.is_ready():
+                return method(self, *args, **kwargs)
+            
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            with self._ttl_lock:
+                entry = self._ttl_cache.get(key)
+            
+            if entry is not None and not force_refresh and time.monotonic() - entry[0] < ttl_seconds:
+                return entry[1]
+            
+            try:
+                value = method(self, *args, **kwargs)
+            except ApiException as e:
+                if entry is None:
+                    raise
+                logger.warning("%s failed (%s); serving cached result from %.0fs ago",
+                               method.__name__, e.reason, time.monotonic() - entry[0])
+                return entry[1]
+            
+            with self._ttl_lock:
+                self._ttl_cache[key] = (time.monotonic(), value)
+            return value
+        return wrapper
+    return decorator
+
+
+def _iso_timestamp(value: Optional[str]) -> Optional[str]:
+    """Render an API timestamp like datetime.isoformat() ("+00:00" rather than "Z")."""
+    if not value:
+        return None
+    return value[:-1] + "+00:00" if value.endswith("Z") else value
+
 
 class KubernetesClient:
     """Kubernetes client for cluster information retrieval."""
     
-    def __init__(self):
-        """Initialize Kubernetes client with cluster configuration."""
+    # Max pooled connections to the API server; sized for concurrent web requests
+    CONNECTION_POOL_MAXSIZE = 50
+    
+    # Page size for LIST calls, bounding each response on large clusters
+    LIST_PAGE_SIZE = 500
+    
+    # TTLs (seconds) for cached list results; pods and services churn faster
+    # than namespaces and nodes
+    SHORT_CACHE_TTL = 30
+    LONG_CACHE_TTL = 300
+    
+    def __init__(self, connection_pool_maxsize: Optional[int] = None):
+        """
+        Initialize Kubernetes client with cluster configuration.
+        
+        Args:
+            connection_pool_maxsize: Max pooled API server connections
+                (defaults to CONNECTION_POOL_MAXSIZE)
+        """
         try:
             # Try to load in-cluster config first (for pods running in cluster)
             config.load_incluster_config()
@@ -27,12 +107,76 @@ class KubernetesClient:
                 config.load_kube_config()
                 logger.info("Loaded local Kubernetes configuration")
             except config.ConfigException as e:
-                logger.error(f"Failed to load Kubernetes configuration: {e}")
+                logger.error("Failed to load Kubernetes configuration: %s", e)
                 raise
         
-        self.v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
+        # The default pool is sized from the CPU count (often just a handful), which serializes concurrent calls
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = connection_pool_maxsize or self.CONNECTION_POOL_MAXSIZE
+        
+        # One ApiClient (and so one urllib3 connection pool) shared by all API groups
+        self.api_client = client.ApiClient(configuration=configuration)
+        self.v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        
+        # Metadata-only view of the same API; default headers override the per-call
+        # Accept header, and the REST client is shared so both use the same pool
+        metadata_api_client = client.ApiClient(
+            configuration=configuration,
+            header_name="Accept",
+            header_value=PARTIAL_METADATA_ACCEPT
+        )
+        metadata_api_client.rest_client = self.api_client.rest_client
+        self._metadata_v1 = client.CoreV1Api(metadata_api_client)
+        
+        # Watch-fed cache of cluster state; None until enable_state_cache() is called
+        self.state_cache: Optional[ClusterStateCache] = None
+        
+        # Long-lived worker pool for concurrent API calls, bounding threads process-wide
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="k8s-io")
+        atexit.register(self._executor.shutdown, wait=False)
+        
+        # (method, args) -> (monotonic timestamp, result), used by @ttl_cached
+        self._ttl_cache: Dict[tuple, tuple] = {}
+        self._ttl_lock = threading.Lock()
+    
+    def enable_state_cache(self) -> ClusterStateCache:
+        """
+        Start the shared watch-fed cache so list calls are served from memory.
+        
+        Returns:
+            The running ClusterStateCache
+        """
+        if self.state_cache is None:
+            self.state_cache = ClusterStateCache(self.v1, page_size=self.LIST_PAGE_SIZE)
+            self.state_cache.start()
+        return self.state_cache
+    
+    def check_ready(self, timeout: float = 2) -> bool:
+        """
+        Cheap API server probe for readiness checks (never cached).
+        
+        Args:
+            timeout: Request timeout in seconds
+            
+        Returns:
+            True if a single metadata-only namespace list succeeded in time
+        """
+        try:
+            response = self._metadata_v1.list_namespace(
+                limit=1, _request_timeout=timeout, _preload_content=False
+            )
+            try:
+                # Read the (one-item) body so urllib3 can return the connection to the pool
+                response.read()
+            finally:
+                response.release_conn()
+            return True
+        except Exception as e:
+            logger.warning("Kubernetes readiness check failed: %s", e)
+            return False
     
+    @ttl_cached(LONG_CACHE_TTL)
     def list_namespaces(self) -> List[Dict[str, Any]]:
         """
         List all namespaces in the cluster.
@@ -41,25 +185,27 @@ class KubernetesClient:
             List of namespace information dictionaries
         """
         try:
-            namespaces = self.v1.list_namespace()
+            namespaces = self._cached_or_list("namespaces", self.v1.list_namespace)
             namespace_list = []
             
-            for ns in namespaces.items:
+            for ns in namespaces:
+                metadata = ns["metadata"]
                 namespace_info = {
-                    "name": ns.metadata.name,
-                    "status": ns.status.phase,
-                    "created": ns.metadata.creation_timestamp.isoformat() if ns.metadata.creation_timestamp else None,
-                    "labels": ns.metadata.labels or {}
+                    "name": metadata["name"],
+                    "status": ns.get("status", {}).get("phase"),
+                    "created": _iso_timestamp(metadata.get("creationTimestamp")),
+                    "labels": metadata.get("labels") or {}
                 }
                 namespace_list.append(namespace_info)
             
-            logger.info(f"Retrieved {len(namespace_list)} namespaces")
+            logger.info("Retrieved %s namespaces", len(namespace_list))
             return namespace_list
             
         except ApiException as e:
-            logger.error(f"Error listing namespaces: {e}")
+            logger.error("Error listing namespaces: %s", e)
             raise
     
+    @ttl_cached(SHORT_CACHE_TTL)
     def list_pods(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List pods in the cluster or specific namespace.
@@ -72,32 +218,36 @@ class KubernetesClient:
         """
         try:
             if namespace:
-                pods = self.v1.list_namespaced_pod(namespace=namespace)
+                pods = self._cached_or_list("pods", self.v1.list_namespaced_pod, namespace=namespace)
             else:
-                pods = self.v1.list_pod_for_all_namespaces()
+                pods = self._cached_or_list("pods", self.v1.list_pod_for_all_namespaces)
             
             pod_list = []
             
-            for pod in pods.items:
+            for pod in pods:
+                metadata = pod["metadata"]
+                status = pod.get("status", {})
+                spec = pod.get("spec", {})
                 pod_info = {
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "status": pod.status.phase,
-                    "ready": self._is_pod_ready(pod),
-                    "restarts": sum(container.restart_count for container in pod.status.container_statuses or []),
-                    "created": pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None,
-                    "node": pod.spec.node_name,
-                    "containers": [c.name for c in pod.spec.containers]
+                    "name": metadata["name"],
+                    "namespace": metadata.get("namespace"),
+                    "status": status.get("phase"),
+                    "ready": any(c["type"] == "Ready" and c["status"] == "True" for c in status.get("conditions") or ()),
+                    "restarts": sum(c.get("restartCount", 0) for c in status.get("containerStatuses") or ()),
+                    "created": _iso_timestamp(metadata.get("creationTimestamp")),
+                    "node": spec.get("nodeName"),
+                    "containers": [c["name"] for c in spec.get("containers", [])]
                 }
                 pod_list.append(pod_info)
             
-            logger.info(f"Retrieved {len(pod_list)} pods")
+            logger.info("Retrieved %s pods", len(pod_list))
             return pod_list
             
         except ApiException as e:
-            logger.error(f"Error listing pods: {e}")
+            logger.error("Error listing pods: %s", e)
             raise
     
+    @ttl_cached(LONG_CACHE_TTL)
     def list_nodes(self) -> List[Dict[str, Any]]:
         """
         List all nodes in the cluster.
@@ -106,35 +256,45 @@ class KubernetesClient:
             List of node information dictionaries
         """
         try:
-            nodes = self.v1.list_node()
+            nodes = self._cached_or_list("nodes", self.v1.list_node)
             node_list = []
             
-            for node in nodes.items:
+            for node in nodes:
+                metadata = node["metadata"]
+                status = node.get("status", {})
+                node_details = status.get("nodeInfo", {})
+                allocatable = status.get("allocatable") or {}
+                
                 # Get node conditions
                 conditions = {}
-                for condition in node.status.conditions or []:
-                    conditions[condition.type] = condition.status
+                for condition in status.get("conditions") or []:
+                    conditions[condition["type"]] = condition["status"]
+                
+                roles = self._get_node_roles(metadata.get("labels") or {})
                 
                 node_info = {
-                    "name": node.metadata.name,
+                    "name": metadata["name"],
                     "status": "Ready" if conditions.get("Ready") == "True" else "NotReady",
-                    "roles": self._get_node_roles(node),
-                    "version": node.status.node_info.kubelet_version,
-                    "os": node.status.node_info.operating_system,
-                    "architecture": node.status.node_info.architecture,
-                    "created": node.metadata.creation_timestamp.isoformat() if node.metadata.creation_timestamp else None,
-                    "allocatable_cpu": node.status.allocatable.get("cpu"),
-                    "allocatable_memory": node.status.allocatable.get("memory")
+                    "roles": roles,
+                    # Preformatted once per snapshot for the tool formatters
+                    "roles_str": ", ".join(roles),
+                    "version": node_details.get("kubeletVersion"),
+                    "os": node_details.get("operatingSystem"),
+                    "architecture": node_details.get("architecture"),
+                    "created": _iso_timestamp(metadata.get("creationTimestamp")),
+                    "allocatable_cpu": allocatable.get("cpu"),
+                    "allocatable_memory": allocatable.get("memory")
                 }
                 node_list.append(node_info)
             
-            logger.info(f"Retrieved {len(node_list)} nodes")
+            logger.info("Retrieved %s nodes", len(node_list))
             return node_list
             
         except ApiException as e:
-            logger.error(f"Error listing nodes: {e}")
+            logger.error("Error listing nodes: %s", e)
             raise
     
+    @ttl_cached(SHORT_CACHE_TTL)
     def list_services(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List services in the cluster or specific namespace.
@@ -147,39 +307,45 @@ class KubernetesClient:
         """
         try:
             if namespace:
-                services = self.v1.list_namespaced_service(namespace=namespace)
+                services = self._cached_or_list("services", self.v1.list_namespaced_service, namespace=namespace)
             else:
-                services = self.v1.list_service_for_all_namespaces()
+                services = self._cached_or_list("services", self.v1.list_service_for_all_namespaces)
             
             service_list = []
             
-            for svc in services.items:
+            for svc in services:
+                metadata = svc["metadata"]
+                spec = svc.get("spec", {})
+                ports = [
+                    {
+                        "port": port.get("port"),
+                        "target_port": str(port["targetPort"]) if port.get("targetPort") else None,
+                        "protocol": port.get("protocol")
+                    }
+                    for port in spec.get("ports") or []
+                ]
                 service_info = {
-                    "name": svc.metadata.name,
-                    "namespace": svc.metadata.namespace,
-                    "type": svc.spec.type,
-                    "cluster_ip": svc.spec.cluster_ip,
-                    "external_ips": svc.spec.external_i_ps or [],
-                    "ports": [
-                        {
-                            "port": port.port,
-                            "target_port": str(port.target_port) if port.target_port else None,
-                            "protocol": port.protocol
-                        }
-                        for port in svc.spec.ports or []
-                    ],
-                    "selector": svc.spec.selector or {},
-                    "created": svc.metadata.creation_timestamp.isoformat() if svc.metadata.creation_timestamp else None
+                    "name": metadata["name"],
+                    "namespace": metadata.get("namespace"),
+                    "type": spec.get("type"),
+                    "cluster_ip": spec.get("clusterIP"),
+                    "external_ips": spec.get("externalIPs") or [],
+                    "ports": ports,
+                    # Preformatted once per snapshot for the tool formatters
+                    "ports_str": ", ".join(f"{p['port']}/{p['protocol']}" for p in ports),
+                    "selector": spec.get("selector") or {},
+                    "created": _iso_timestamp(metadata.get("creationTimestamp"))
                 }
                 service_list.append(service_info)
             
-            logger.info(f"Retrieved {len(service_list)} services")
+            logger.info("Retrieved %s services", len(service_list))
             return service_list
             
         except ApiException as e:
-            logger.error(f"Error listing services: {e}")
+            logger.error("Error listing services: %s", e)
             raise
     
+    @ttl_cached(SHORT_CACHE_TTL)
     def get_cluster_info(self) -> Dict[str, Any]:
         """
         Get general cluster information.
@@ -187,54 +353,192 @@ class KubernetesClient:
         Returns:
             Dictionary with cluster summary information
         """
+        if self.state_cache is not None and self.state_cache.is_ready():
+            return self._cluster_info_from_cache()
+        
         try:
-            # Get basic counts
-            namespaces = self.list_namespaces()
-            pods = self.list_pods()
-            nodes = self.list_nodes()
-            services = self.list_services()
+            # The queries are independent, so run them concurrently. Namespaces, pods
+            # and services only need names or counts, so they use metadata-only lists;
+            # nodes are few and need status fields, so they use the full list.
+            namespaces_future = self._executor.submit(self._list_metadata, "list_namespace")
+            pods_future = self._executor.submit(self._count_pods_by_phase)
+            nodes_future = self._executor.submit(self.list_nodes)
+            services_future = self._executor.submit(self._count_metadata, "list_service_for_all_namespaces")
+            
+            # .result() re-raises the first ApiException in submission order
+            namespaces = namespaces_future.result()
+            total_pods, running_pods = pods_future.result()
+            nodes = nodes_future.result()
+            total_services = services_future.result()
             
             # Calculate statistics
-            running_pods = len([p for p in pods if p["status"] == "Running"])
-            ready_nodes = len([n for n in nodes if n["status"] == "Ready"])
+            ready_nodes = sum(1 for n in nodes if n["status"] == "Ready")
             
             cluster_info = {
                 "total_namespaces": len(namespaces),
-                "total_pods": len(pods),
+                "total_pods": total_pods,
                 "running_pods": running_pods,
                 "total_nodes": len(nodes),
                 "ready_nodes": ready_nodes,
-                "total_services": len(services),
-                "node_versions": list(set(n["version"] for n in nodes)),
-                "namespaces": [ns["name"] for ns in namespaces]
+                "total_services": total_services,
+                "node_versions": list({n["version"] for n in nodes}),
+                "namespaces": [ns["metadata"]["name"] for ns in namespaces]
             }
             
             logger.info("Retrieved cluster summary information")
             return cluster_info
             
         except Exception as e:
-            logger.error(f"Error getting cluster info: {e}")
+            logger.error("Error getting cluster info: %s", e)
             raise
     
-    def _is_pod_ready(self, pod) -> bool:
-        """Check if a pod is ready."""
-        if not pod.status.conditions:
-            return False
+    def _cluster_info_from_cache(self) -> Dict[str, Any]:
+        """Build the cluster summary from the state cache without calling the API."""
+        namespaces = self.state_cache.get("namespaces")
+        pods = self.state_cache.get("pods")
+        nodes = self.list_nodes()
+        
+        cluster_info = {
+            "total_namespaces": len(namespaces),
+            "total_pods": len(pods),
+            "running_pods": sum(1 for pod in pods if pod.get("status", {}).get("phase") == "Running"),
+            "total_nodes": len(nodes),
+            "ready_nodes": sum(1 for n in nodes if n["status"] == "Ready"),
+            "total_services": len(self.state_cache.get("services")),
+            "node_versions": list({n["version"] for n in nodes}),
+            "namespaces": [ns["metadata"]["name"] for ns in namespaces]
+        }
         
-        for condition in pod.status.conditions:
-            if condition.type == "Ready":
-                return condition.status == "True"
-        return False
+        logger.info("Retrieved cluster summary information from state cache")
+        return cluster_info
     
-    def _get_node_roles(self, node) -> List[str]:
-        """Extract node roles from labels."""
-        roles = []
-        labels = node.metadata.labels or {}
+    def _cached_or_list(self, resource: str, list_fn, namespace: Optional[str] = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Get raw resource dicts from the state cache if it is populated, else from the API.
+        
+        Args:
+            resource: State cache resource name, e.g. "pods"
+            list_fn: Bound list method to page through on a cache miss
+            namespace: Optional namespace filter (also passed to list_fn)
+        """
+        if self.state_cache is not None:
+            cached = self.state_cache.get(resource, namespace)
+            if cached is not None:
+                return iter(cached)
         
-        for label_key in labels:
-            if label_key.startswith("node-role.kubernetes.io/"):
-                role = label_key.replace("node-role.kubernetes.io/", "")
-                if role:
-                    roles.append(role)
+        if namespace:
+            kwargs["namespace"] = namespace
+        return self._paged_list(list_fn, **kwargs)
+    
+    def _paged_list(self, list_fn, limit: int = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield items from a CoreV1Api list call as raw JSON dicts, one page at a time.
         
-        return roles if roles else ["worker"]
+        Args:
+            list_fn: Bound list method, e.g. self.v1.list_node
+            limit: Page size (defaults to LIST_PAGE_SIZE)
+        """
+        if not LEGACY_DESERIALIZE:
+            yield from self._iter_raw(list_fn, limit=limit, **kwargs)
+            return
+        
+        # Model objects serialized back to the same camelCase dicts the API returns
+        token = None
+        while True:
+            page = list_fn(limit=limit or self.LIST_PAGE_SIZE, _continue=token, **kwargs)
+            for item in page.items:
+                yield self.api_client.sanitize_for_serialization(item)
+            token = page.metadata._continue
+            if not token:
+                return
+    
+    def _iter_raw(self, list_fn, limit: int = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield items from a list call parsed straight from the response body with
+        orjson, skipping the client's model deserialization.
+        
+        Args:
+            list_fn: Bound list method, e.g. self.v1.list_node
+            limit: Page size (defaults to LIST_PAGE_SIZE)
+        """
+        token = None
+        while True:
+            response = list_fn(limit=limit or self.LIST_PAGE_SIZE, _continue=token,
+                               _preload_content=False, **kwargs)
+            try:
+                page = orjson.loads(response.data)
+            finally:
+                response.release_conn()
+            yield from page["items"] or []
+            token = page["metadata"].get("continue")
+            if not token:
+                return
+    
+    def _iter_metadata(self, list_method: str, limit: int = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield resources as raw PartialObjectMetadata dicts, one page at a time.
+        
+        Args:
+            list_method: Name of the CoreV1Api list method, e.g. "list_namespace"
+            limit: Page size (defaults to LIST_PAGE_SIZE)
+        """
+        return self._iter_raw(getattr(self._metadata_v1, list_method), limit=limit, **kwargs)
+    
+    def _list_metadata(self, list_method: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        List resources as PartialObjectMetadata and return the raw item dicts.
+        
+        Args:
+            list_method: Name of the CoreV1Api list method, e.g. "list_namespace"
+            
+        Returns:
+            Items with only apiVersion, kind and metadata populated
+        """
+        return list(self._iter_metadata(list_method, **kwargs))
+    
+    def _count_metadata(self, list_method: str, **kwargs) -> int:
+        """Count resources without building their dicts, using metadata-only pages."""
+        return sum(1 for _ in self._iter_metadata(list_method, **kwargs))
+    
+    def _count_pods_by_phase(self) -> tuple:
+        """
+        Count pods across all namespaces.
+        
+        Returns:
+            (total pods, running pods); the running count is filtered server-side
+        """
+        total = self._count_metadata("list_pod_for_all_namespaces")
+        running = self._count_metadata("list_pod_for_all_namespaces", field_selector="status.phase=Running")
+        return total, running
+    
+    def _get_node_roles(self, labels: Dict[str, str]) -> List[str]:
+        """Extract node roles from labels."""
+        # Slicing rather than str.removeprefix, which needs Python 3.9
+        roles = [key[NODE_ROLE_PREFIX_LEN:] for key in labels
+                 if key.startswith(NODE_ROLE_PREFIX) and len(key) > NODE_ROLE_PREFIX_LEN]
+        return roles or ["worker"]
+
+
+_client_instance: Optional[KubernetesClient] = None
+_client_lock = threading.Lock()
+
+
+def get_k8s_client(connection_pool_maxsize: Optional[int] = None) -> KubernetesClient:
+    """
+    Get the process-wide Kubernetes client, creating it on first use.
+    
+    Reusing one client keeps kubeconfig parsing and TLS handshakes out of the
+    request path.
+    
+    Args:
+        connection_pool_maxsize: Pool size for the client; only applies when
+            this call creates it
+    """
+    global _client_instance
+    if _client_instance is None:
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = KubernetesClient(connection_pool_maxsize=connection_pool_maxsize)
+                if os.getenv("K8S_WATCH_CACHE", "false").lower() == "true":
+                    _client_instance.enable_state_cache()
+    return _client_instance
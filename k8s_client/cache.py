@@ -0,0 +1,188 @@
+"""
+In-memory cluster state cache for the Kubernetes client.
+Keeps pods, nodes, namespaces, and services in memory as raw API dicts, updated
+by watch streams with a periodic full relist as a fallback.
+"""
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+import orjson
+from typing import List, Dict, Any, Optional, Tuple
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ClusterStateCache:
+    """Watch-fed cache of cluster resources, shared by all readers of a KubernetesClient."""
+
+    # Resource name -> CoreV1Api list method used for both relist and watch
+    RESOURCES = {
+        "pods": "list_pod_for_all_namespaces",
+        "nodes": "list_node",
+        "namespaces": "list_namespace",
+        "services": "list_service_for_all_namespaces"
+    }
+
+    # Seconds between full relists (self-healing if a watch silently misses events);
+    # each resource is relisted on its own watch thread, between watch requests
+    RELIST_INTERVAL = 60
+
+    # Server-side timeout for a single watch request; the watch is reopened afterwards
+    WATCH_TIMEOUT = 300
+
+    # Seconds to wait before reopening a watch after an error
+    RETRY_DELAY = 5
+
+    def __init__(self, v1, page_size: int = 500):
+        """
+        Initialize the cache (call start() to begin watching).
+
+        Args:
+            v1: CoreV1Api instance used for list and watch calls
+            page_size: Page size for relist calls
+        """
+        self.v1 = v1
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._objects: Dict[str, Dict[Tuple[Optional[str], str], Any]] = {name: {} for name in self.RESOURCES}
+        self._resource_versions: Dict[str, Optional[str]] = {name: None for name in self.RESOURCES}
+        self._ready = {name: threading.Event() for name in self.RESOURCES}
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Start one watch thread per resource."""
+        if self._threads:
+            return
+
+        for resource in self.RESOURCES:
+            thread = threading.Thread(
+                target=self._watch_loop, args=(resource,),
+                name=f"k8s-watch-{resource}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info("Started cluster state cache")
+
+    def stop(self):
+        """Signal background threads to stop (watches exit at their next event or timeout)."""
+        self._stop.set()
+
+    def is_ready(self, resource: str = None) -> bool:
+        """Whether a resource (or every resource, if None) has been populated."""
+        if resource is not None:
+            return self._ready[resource].is_set()
+        return all(event.is_set() for event in self._ready.values())
+
+    def get(self, resource: str, namespace: Optional[str] = None) -> Optional[List[Any]]:
+        """
+        Get cached objects for a resource.
+
+        Args:
+            resource: One of RESOURCES
+            namespace: Optional namespace to filter by
+
+        Returns:
+            List of cached raw object dicts, or None if the resource isn't populated yet
+        """
+        if not self._ready[resource].is_set():
+            return None
+
+        with self._lock:
+            objects = self._objects[resource]
+            if namespace is None:
+                return list(objects.values())
+            return [obj for (obj_namespace, _), obj in objects.items() if obj_namespace == namespace]
+
+    def _relist(self, resource: str):
+        """Replace the cached objects for a resource with a fresh paged list."""
+        list_fn = getattr(self.v1, self.RESOURCES[resource])
+        objects = {}
+        resource_version = None
+        token = None
+
+        while True:
+            response = list_fn(limit=self.page_size, _continue=token, _preload_content=False)
+            try:
+                page = orjson.loads(response.data)
+            finally:
+                response.release_conn()
+            # The first page's resourceVersion identifies the consistent snapshot
+            if resource_version is None:
+                resource_version = page["metadata"].get("resourceVersion")
+            for obj in page["items"] or []:
+                objects[self._key(obj)] = obj
+            token = page["metadata"].get("continue")
+            if not token:
+                break
+
+        with self._lock:
+            self._objects[resource] = objects
+            self._resource_versions[resource] = resource_version
+        self._ready[resource].set()
+        logger.debug("Relisted %s %s", len(objects), resource)
+
+    def _watch_loop(self, resource: str):
+        """
+        Apply watch events for a resource until stopped, relisting when required.
+
+        This thread is the only writer for its resource: the periodic relist runs here
+        between watch requests, so a snapshot can never overwrite newer watch events.
+        """
+        list_fn = getattr(self.v1, self.RESOURCES[resource])
+        relist_at = 0.0
+
+        while not self._stop.is_set():
+            try:
+                if not self._ready[resource].is_set() or time.monotonic() >= relist_at:
+                    self._relist(resource)
+                    relist_at = time.monotonic() + self.RELIST_INTERVAL
+
+                # The server ends the watch once the next relist is due. return_type="object"
+                # yields plain dicts instead of generated models
+                stream = watch.Watch(return_type="object").stream(
+                    list_fn,
+                    resource_version=self._resource_versions[resource],
+                    timeout_seconds=max(1, min(self.WATCH_TIMEOUT, math.ceil(relist_at - time.monotonic())))
+                )
+                for event in stream:
+                    if self._stop.is_set():
+                        return
+                    self._apply_event(resource, event)
+
+            except ApiException as e:
+                if e.status == 410:
+                    # Our resourceVersion is too old; start again from a fresh list
+                    logger.info("Watch for %s expired, relisting", resource)
+                    self._ready[resource].clear()
+                    continue
+                logger.warning("Watch for %s failed: %s", resource, e)
+                self._stop.wait(self.RETRY_DELAY)
+            except Exception as e:
+                logger.warning("Watch for %s failed: %s", resource, e)
+                self._stop.wait(self.RETRY_DELAY)
+
+    def _apply_event(self, resource: str, event: Dict[str, Any]):
+        """Apply a single ADDED/MODIFIED/DELETED watch event to the cache."""
+        if event["type"] not in ("ADDED", "MODIFIED", "DELETED"):
+            return
+
+        obj = event["raw_object"]
+        key = self._key(obj)
+
+        with self._lock:
+            if event["type"] in ("ADDED", "MODIFIED"):
+                self._objects[resource][key] = obj
+            elif event["type"] == "DELETED":
+                self._objects[resource].pop(key, None)
+            self._resource_versions[resource] = obj["metadata"].get("resourceVersion")
+
+    @staticmethod
+    def _key(obj: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """Cache key for a raw object: (namespace, name)."""
+        metadata = obj["metadata"]
+        return metadata.get("namespace"), metadata["name"]
@@ -6,19 +6,20 @@ Command-line interface for the Kubernetes cluster information system.
 import click
 import os
 import sys
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.prompt import Prompt
 from rich.table import Table
 import logging
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from agent import create_kubernetes_agent
-from bedrock import BedrockLLM
+# agent and bedrock (boto3, langchain) are imported inside the commands that need
+# them, so --help and light commands don't pay their import cost
+if TYPE_CHECKING:
+    from agent import KubernetesGraphAgent
 
 # Setup rich console for better output
 console = Console()
@@ -67,35 +68,58 @@ def print_examples():
     console.print()
 
 
-def test_setup() -> bool:
-    """Test if all components are properly configured."""
+def print_streamed_response(agent, user_input: str):
+    """Render the agent's response in a panel that fills in as text streams from the model."""
+    from rich.live import Live
+    
+    if not hasattr(agent, "query_stream"):
+        console.print(Panel(agent.query(user_input), title="Response", style="green"))
+        return
+    
+    chunks = []
+    with Live(Panel("", title="Response", style="green"), console=console, refresh_per_second=10) as live:
+        for chunk in agent.query_stream(user_input):
+            chunks.append(chunk)
+            live.update(Panel("".join(chunks), title="Response", style="green"))
+
+
+def test_setup(model_name: Optional[str] = None, region: Optional[str] = None) -> Optional["KubernetesGraphAgent"]:
+    """
+    Test if all components are properly configured.
+    
+    Returns:
+        The tested agent on success (so callers can reuse it), otherwise None
+    """
     console.print("🔍 Testing setup...", style="yellow")
     
     try:
-        # Test Bedrock connection
+        from agent import create_kubernetes_agent
+        from bedrock import create_bedrock_llm
+        
+        # Test Bedrock connection (the shared instance the agent will also use)
         console.print("  Testing AWS Bedrock connection...", end="")
-        bedrock_llm = BedrockLLM()
+        bedrock_llm = create_bedrock_llm(model_name=model_name, region=region)
         if bedrock_llm.test_connection():
             console.print(" ✅", style="green")
         else:
             console.print(" ❌", style="red")
-            return False
+            return None
         
         # Test agent initialization
         console.print("  Testing agent initialization...", end="")
-        agent = create_kubernetes_agent()
+        agent = create_kubernetes_agent(model_name=model_name, region=region)
         if agent.test_agent():
             console.print(" ✅", style="green")
         else:
             console.print(" ❌", style="red")
-            return False
+            return None
         
         console.print("✅ Setup test completed successfully!", style="green")
-        return True
+        return agent
         
     except Exception as e:
         console.print(f" ❌ Error: {e}", style="red")
-        return False
+        return None
 
 
 @click.group()
@@ -106,18 +130,20 @@ def cli():
 
 @cli.command()
 @click.option('--model', default='claude-3-haiku', 
-              help='Bedrock model to use (claude-3-haiku, claude-3-sonnet, titan-text)')
+              help='Bedrock model to use (claude-3-haiku, claude-3-5-haiku, claude-3-sonnet, llama3-1-70b, titan-text)')
 @click.option('--region', default=None, 
               help='AWS region for Bedrock (defaults to AWS_REGION env var or us-west-2)')
 @click.option('--test-only', is_flag=True, 
               help='Only test the setup without starting interactive mode')
 def interactive(model: str, region: Optional[str], test_only: bool):
     """Start interactive mode for querying cluster information."""
+    from rich.prompt import Prompt
     
     print_welcome()
     
-    # Test setup
-    if not test_setup():
+    # Test setup with the requested model, so the tested agent is the one we use
+    agent = test_setup(model_name=model, region=region)
+    if agent is None:
         console.print("❌ Setup test failed. Please check your configuration.", style="red")
         console.print("\nCommon issues:", style="yellow")
         console.print("1. AWS credentials not configured (run 'aws configure')")
@@ -130,9 +156,7 @@ def interactive(model: str, region: Optional[str], test_only: bool):
         return
     
     try:
-        # Initialize agent
-        console.print(f"🤖 Initializing agent with model: {model}", style="blue")
-        agent = create_kubernetes_agent(model_name=model, region=region)
+        console.print(f"🤖 Using agent with model: {model}", style="blue")
         
         # Show agent info
         agent_info = agent.get_agent_info()
@@ -164,18 +188,10 @@ def interactive(model: str, region: Optional[str], test_only: bool):
                     print_welcome()
                     continue
                 
-                # Process query
+                # Process query, displaying the response as it streams in
                 console.print("🤔 Thinking...", style="yellow")
-                response = agent.query(user_input)
-                
-                # Display response
                 console.print()
-                response_panel = Panel(
-                    response,
-                    title="Response",
-                    style="green"
-                )
-                console.print(response_panel)
+                print_streamed_response(agent, user_input)
                 console.print()
                 
             except KeyboardInterrupt:
@@ -198,6 +214,8 @@ def query(query: str, model: str, region: Optional[str]):
     """Execute a single query and return the result."""
     
     try:
+        from agent import create_kubernetes_agent
+        
         # Initialize agent
         agent = create_kubernetes_agent(model_name=model, region=region)
         
@@ -215,6 +233,7 @@ def query(query: str, model: str, region: Optional[str]):
 @cli.command()
 def models():
     """List available Bedrock models."""
+    from bedrock import BedrockLLM
     
     available_models = BedrockLLM.list_available_models()
     
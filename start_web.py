@@ -3,20 +3,15 @@ Web interface launcher script.
 Simple script to start the Flask web application.
 """
 
-import os
 import sys
-import subprocess
 from pathlib import Path
 
 def main():
     """Launch the web interface."""
     # Get the project root directory
-    project_root = Path(__file__).parent
+    project_root = Path(__file__).resolve().parent
     web_dir = project_root / "web"
     
-    # Change to web directory
-    os.chdir(web_dir)
-    
     # Add project root to Python path
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
@@ -29,26 +24,23 @@ def main():
     
     try:
         # Run the Flask app
-        from web.app import app, initialize_agent
+        from web.app import app, start_warmup
         
-        # Initialize agent first
-        print("🤖 Initializing Kubernetes agent...")
-        if initialize_agent():
-            print("✅ Agent initialized successfully")
-            print("🌐 Starting web server...")
-            print("📱 Open your browser and navigate to: http://localhost:5000")
-            print("⏹️  Press Ctrl+C to stop the server")
-            print()
-            
-            app.run(
-                host='0.0.0.0',
-                port=5000,
-                debug=False
-            )
-        else:
-            print("❌ Failed to initialize agent")
-            print("Please check your AWS and Kubernetes configuration")
-            return 1
+        # Initialize the agent in the background; API calls return 503 until it's ready
+        print("🤖 Initializing Kubernetes agent in the background...")
+        start_warmup()
+        
+        print("🌐 Starting web server...")
+        print("📱 Open your browser and navigate to: http://localhost:5000")
+        print("⏹️  Press Ctrl+C to stop the server")
+        print()
+        
+        app.run(
+            host='0.0.0.0',
+            port=5000,
+            debug=False,
+            threaded=True
+        )
             
     except ImportError as e:
         print(f"❌ Import error: {e}")
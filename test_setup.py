@@ -4,94 +4,104 @@ Example usage and testing script for the Kubernetes cluster interface.
 
 import sys
 import os
+import io
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from k8s_client import KubernetesClient
-from tools.k8s_tools import get_kubernetes_tools
-from bedrock import create_bedrock_llm
-from agent import create_kubernetes_agent
+# Each test imports what it exercises, so a missing dependency (kubernetes, boto3,
+# langchain) fails that test instead of the whole script, and nothing heavy loads
+# before the tests start
 
 
-def test_k8s_client():
+def test_k8s_client(log=print):
     """Test the Kubernetes client directly."""
-    print("Testing Kubernetes Client...")
+    log("Testing Kubernetes Client...")
     
     try:
-        client = KubernetesClient()
+        from k8s_client import get_k8s_client
+        
+        client = get_k8s_client()
         
         # Test cluster info
         cluster_info = client.get_cluster_info()
-        print(f"✅ Cluster Info: {cluster_info['total_namespaces']} namespaces, {cluster_info['total_pods']} pods")
+        log(f"✅ Cluster Info: {cluster_info['total_namespaces']} namespaces, {cluster_info['total_pods']} pods")
         
         # Test namespaces
         namespaces = client.list_namespaces()
-        print(f"✅ Namespaces: Found {len(namespaces)} namespaces")
+        log(f"✅ Namespaces: Found {len(namespaces)} namespaces")
         
         return True
         
     except Exception as e:
-        print(f"❌ Kubernetes client error: {e}")
+        log(f"❌ Kubernetes client error: {e}")
         return False
 
 
-def test_bedrock_llm():
+def test_bedrock_llm(log=print):
     """Test the Bedrock LLM connection."""
-    print("Testing Bedrock LLM...")
+    log("Testing Bedrock LLM...")
     
     try:
+        from bedrock import create_bedrock_llm
+        
         bedrock = create_bedrock_llm()
         
         # Test connection
         if bedrock.test_connection():
-            print("✅ Bedrock connection successful")
+            log("✅ Bedrock connection successful")
             return True
         else:
-            print("❌ Bedrock connection failed")
+            log("❌ Bedrock connection failed")
             return False
             
     except Exception as e:
-        print(f"❌ Bedrock error: {e}")
+        log(f"❌ Bedrock error: {e}")
         return False
 
 
-def test_tools():
+def test_tools(log=print):
     """Test the LangChain tools."""
-    print("Testing LangChain Tools...")
+    log("Testing LangChain Tools...")
     
     try:
-        k8s_client = KubernetesClient()
+        from k8s_client import get_k8s_client
+        from tools.k8s_tools import get_kubernetes_tools
+        
+        k8s_client = get_k8s_client()
         tools = get_kubernetes_tools(k8s_client)
-        print(f"✅ Loaded {len(tools)} tools: {[tool.name for tool in tools]}")
+        log(f"✅ Loaded {len(tools)} tools: {[tool.name for tool in tools]}")
         
         # Test one tool
         cluster_tool = next(tool for tool in tools if tool.name == "get_cluster_info")
         result = cluster_tool._run()
-        print(f"✅ Tool test result: {result[:100]}...")
+        log(f"✅ Tool test result: {result[:100]}...")
         
         return True
         
     except Exception as e:
-        print(f"❌ Tools error: {e}")
+        log(f"❌ Tools error: {e}")
         return False
 
 
-def test_agent():
+def test_agent(log=print):
     """Test the complete agent."""
-    print("Testing Complete Agent...")
+    log("Testing Complete Agent...")
     
     try:
+        from agent import create_kubernetes_agent
+        
         agent = create_kubernetes_agent()
         
         # Test simple query
         response = agent.query("What's the cluster overview?")
-        print(f"✅ Agent response: {response[:100]}...")
+        log(f"✅ Agent response: {response[:100]}...")
         
         return True
         
     except Exception as e:
-        print(f"❌ Agent error: {e}")
+        log(f"❌ Agent error: {e}")
         return False
 
 
@@ -108,14 +118,25 @@ def main():
     
     results = []
     
-    for test_name, test_func in tests:
+    # The tests are independent network checks, so run them concurrently. Each
+    # writes to its own buffer (redirect_stdout isn't thread-safe), and the
+    # buffers are printed in the original order once everything finishes.
+    buffers = [io.StringIO() for _ in tests]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [
+            executor.submit(test_func, lambda *args, buf=buf: print(*args, file=buf))
+            for (_, test_func), buf in zip(tests, buffers)
+        ]
+    
+    for (test_name, _), future, buf in zip(tests, futures, buffers):
         print(f"{'='*50}")
         print(f"Testing: {test_name}")
         print(f"{'='*50}")
         
-        success = test_func()
+        success = future.result()
         results.append((test_name, success))
         
+        print(buf.getvalue(), end="")
         print(f"Result: {'✅ PASSED' if success else '❌ FAILED'}")
         print()
     
@@ -2,6 +2,12 @@
 Tools package initialization.
 """
 
-from .k8s_tools import get_kubernetes_tools
-
 __all__ = ['get_kubernetes_tools']
+
+
+def __getattr__(name):
+    # Imported lazily so tools.simple_tools doesn't pay for the LangChain tool classes
+    if name == 'get_kubernetes_tools':
+        from .k8s_tools import get_kubernetes_tools
+        return get_kubernetes_tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,9 @@ These tools wrap the Kubernetes client functions for use with LLM agents.
 """
 
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Type, Optional, List
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from collections import defaultdict
+from typing import Any, ClassVar, Dict, Type, Optional, List, Union
 from k8s_client import KubernetesClient
 
 
@@ -48,24 +49,42 @@ class GetClusterInfoInput(BaseModel):
 # Tool Implementations
 # ------------------------
 
-class KubernetesListNamespacesTool(BaseTool):
+class KubernetesBaseTool(BaseTool):
+    """Base for the Kubernetes tools: holds the shared client and validates input with pydantic v2."""
+
+    k8s_client: Any = None
+
+    # Built once per tool class; subclasses set it to TypeAdapter(<their args_schema>)
+    args_adapter: ClassVar[TypeAdapter]
+
+    def __init__(self, k8s_client: KubernetesClient):
+        super().__init__(k8s_client=k8s_client)
+
+    def _parse_input(self, tool_input: Union[str, Dict], tool_call_id: Optional[str] = None) -> Union[str, Dict[str, Any]]:
+        # BaseTool's default rescans the schema annotations for injected arguments and
+        # dumps the whole model on every call; validate with the precompiled adapter instead
+        if isinstance(tool_input, str):
+            return super()._parse_input(tool_input, tool_call_id)
+
+        validated = self.args_adapter.validate_python(tool_input)
+        return {k: getattr(validated, k) for k in tool_input if k in validated.model_fields}
+
+
+class KubernetesListNamespacesTool(KubernetesBaseTool):
     """Tool for listing Kubernetes namespaces."""
 
-    name = "list_namespaces"
-    description = """
+    name: str = "list_namespaces"
+    description: str = """
     List all namespaces in the Kubernetes cluster.
     Use this tool when users ask about namespaces, want to see what namespaces exist,
     or need to understand the cluster organization.
     Returns information about namespace names, status, creation time, and labels.
     """
     args_schema: Type[BaseModel] = ListNamespacesInput
+    args_adapter = TypeAdapter(ListNamespacesInput)
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, k8s_client: KubernetesClient):
-        super().__init__()
-        self.k8s_client = k8s_client
-
     def _run(self) -> str:
         try:
             namespaces = self.k8s_client.list_namespaces()
@@ -73,36 +92,34 @@ class KubernetesListNamespacesTool(BaseTool):
             if not namespaces:
                 return "No namespaces found in the cluster."
 
-            response = f"Found {len(namespaces)} namespaces:\n\n"
+            parts = [f"Found {len(namespaces)} namespaces:\n\n"]
+            parts_append = parts.append
             for ns in namespaces:
-                response += f"• **{ns['name']}** (Status: {ns['status']})\n"
+                parts_append(f"• **{ns['name']}** (Status: {ns['status']})\n")
                 if ns['created']:
-                    response += f"  Created: {ns['created']}\n"
+                    parts_append(f"  Created: {ns['created']}\n")
 
-            return response
+            return "".join(parts)
 
         except Exception as e:
             return f"Error retrieving namespaces: {str(e)}"
 
 
-class KubernetesListPodsTool(BaseTool):
+class KubernetesListPodsTool(KubernetesBaseTool):
     """Tool for listing Kubernetes pods."""
 
-    name = "list_pods"
-    description = """
+    name: str = "list_pods"
+    description: str = """
     List pods in the Kubernetes cluster, optionally filtered by namespace.
     Use this tool when users ask about pods, running containers, pod status,
     or want to see what applications are deployed.
     Returns information about pod names, namespaces, status, readiness, and restart counts.
     """
     args_schema: Type[BaseModel] = ListPodsInput
+    args_adapter = TypeAdapter(ListPodsInput)
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, k8s_client: KubernetesClient):
-        super().__init__()
-        self.k8s_client = k8s_client
-
     def _run(self, namespace: Optional[str] = None) -> str:
         try:
             pods = self.k8s_client.list_pods(namespace=namespace)
@@ -112,48 +129,45 @@ class KubernetesListPodsTool(BaseTool):
                 return f"No pods found{ns_text}."
 
             # Group pods by status for better readability
-            status_groups = {}
+            status_groups = defaultdict(list)
             for pod in pods:
-                status = pod['status']
-                status_groups.setdefault(status, []).append(pod)
+                status_groups[pod['status']].append(pod)
 
             ns_text = f" in namespace '{namespace}'" if namespace else ""
-            response = f"Found {len(pods)} pods{ns_text}:\n\n"
+            parts = [f"Found {len(pods)} pods{ns_text}:\n\n"]
+            parts_append = parts.append
 
             for status, pod_list in status_groups.items():
-                response += f"**{status} ({len(pod_list)} pods):**\n"
+                parts_append(f"**{status} ({len(pod_list)} pods):**\n")
                 for pod in pod_list:
                     ready_text = "✓" if pod['ready'] else "✗"
-                    response += f"• {pod['name']} ({pod['namespace']}) {ready_text}"
+                    parts_append(f"• {pod['name']} ({pod['namespace']}) {ready_text}")
                     if pod['restarts'] > 0:
-                        response += f" [Restarts: {pod['restarts']}]"
-                    response += "\n"
-                response += "\n"
+                        parts_append(f" [Restarts: {pod['restarts']}]")
+                    parts_append("\n")
+                parts_append("\n")
 
-            return response
+            return "".join(parts)
 
         except Exception as e:
             return f"Error retrieving pods: {str(e)}"
 
 
-class KubernetesListNodesTool(BaseTool):
+class KubernetesListNodesTool(KubernetesBaseTool):
     """Tool for listing Kubernetes nodes."""
 
-    name = "list_nodes"
-    description = """
+    name: str = "list_nodes"
+    description: str = """
     List all nodes in the Kubernetes cluster.
     Use this tool when users ask about nodes, cluster capacity, node status,
     or infrastructure information.
     Returns information about node names, status, roles, versions, and resource capacity.
     """
     args_schema: Type[BaseModel] = ListNodesInput
+    args_adapter = TypeAdapter(ListNodesInput)
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, k8s_client: KubernetesClient):
-        super().__init__()
-        self.k8s_client = k8s_client
-
     def _run(self) -> str:
         try:
             nodes = self.k8s_client.list_nodes()
@@ -162,44 +176,41 @@ class KubernetesListNodesTool(BaseTool):
                 return "No nodes found in the cluster."
 
             ready_nodes = len([n for n in nodes if n['status'] == 'Ready'])
-            response = f"Found {len(nodes)} nodes ({ready_nodes} ready):\n\n"
+            parts = [f"Found {len(nodes)} nodes ({ready_nodes} ready):\n\n"]
+            parts_append = parts.append
 
             for node in nodes:
                 status_icon = "✓" if node['status'] == 'Ready' else "✗"
-                roles = ", ".join(node['roles']) if node['roles'] else "worker"
 
-                response += f"• **{node['name']}** {status_icon}\n"
-                response += f"  Roles: {roles}\n"
-                response += f"  Version: {node['version']}\n"
-                response += f"  OS: {node['os']} ({node['architecture']})\n"
+                parts_append(f"• **{node['name']}** {status_icon}\n")
+                parts_append(f"  Roles: {node['roles_str']}\n")
+                parts_append(f"  Version: {node['version']}\n")
+                parts_append(f"  OS: {node['os']} ({node['architecture']})\n")
                 if node['allocatable_cpu'] and node['allocatable_memory']:
-                    response += f"  Resources: {node['allocatable_cpu']} CPU, {node['allocatable_memory']} memory\n"
-                response += "\n"
+                    parts_append(f"  Resources: {node['allocatable_cpu']} CPU, {node['allocatable_memory']} memory\n")
+                parts_append("\n")
 
-            return response
+            return "".join(parts)
 
         except Exception as e:
             return f"Error retrieving nodes: {str(e)}"
 
 
-class KubernetesListServicesTool(BaseTool):
+class KubernetesListServicesTool(KubernetesBaseTool):
     """Tool for listing Kubernetes services."""
 
-    name = "list_services"
-    description = """
+    name: str = "list_services"
+    description: str = """
     List services in the Kubernetes cluster, optionally filtered by namespace.
     Use this tool when users ask about services, network endpoints, load balancers,
     or how applications are exposed.
     Returns information about service names, types, IPs, and ports.
     """
     args_schema: Type[BaseModel] = ListServicesInput
+    args_adapter = TypeAdapter(ListServicesInput)
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, k8s_client: KubernetesClient):
-        super().__init__()
-        self.k8s_client = k8s_client
-
     def _run(self, namespace: Optional[str] = None) -> str:
         try:
             services = self.k8s_client.list_services(namespace=namespace)
@@ -209,70 +220,68 @@ class KubernetesListServicesTool(BaseTool):
                 return f"No services found{ns_text}."
 
             # Group services by type
-            type_groups = {}
+            type_groups = defaultdict(list)
             for svc in services:
-                type_groups.setdefault(svc['type'], []).append(svc)
+                type_groups[svc['type']].append(svc)
 
             ns_text = f" in namespace '{namespace}'" if namespace else ""
-            response = f"Found {len(services)} services{ns_text}:\n\n"
+            parts = [f"Found {len(services)} services{ns_text}:\n\n"]
+            parts_append = parts.append
 
             for svc_type, svc_list in type_groups.items():
-                response += f"**{svc_type} ({len(svc_list)} services):**\n"
+                parts_append(f"**{svc_type} ({len(svc_list)} services):**\n")
                 for svc in svc_list:
-                    response += f"• **{svc['name']}** ({svc['namespace']})\n"
-                    response += f"  Cluster IP: {svc['cluster_ip']}\n"
+                    parts_append(f"• **{svc['name']}** ({svc['namespace']})\n")
+                    parts_append(f"  Cluster IP: {svc['cluster_ip']}\n")
                     if svc['ports']:
-                        ports = ", ".join([f"{p['port']}/{p['protocol']}" for p in svc['ports']])
-                        response += f"  Ports: {ports}\n"
+                        parts_append(f"  Ports: {svc['ports_str']}\n")
                     if svc['external_ips']:
-                        response += f"  External IPs: {', '.join(svc['external_ips'])}\n"
-                response += "\n"
+                        parts_append(f"  External IPs: {', '.join(svc['external_ips'])}\n")
+                parts_append("\n")
 
-            return response
+            return "".join(parts)
 
         except Exception as e:
             return f"Error retrieving services: {str(e)}"
 
 
-class KubernetesGetClusterInfoTool(BaseTool):
+class KubernetesGetClusterInfoTool(KubernetesBaseTool):
     """Tool for getting general cluster information."""
 
-    name = "get_cluster_info"
-    description = """
+    name: str = "get_cluster_info"
+    description: str = """
     Get general information and statistics about the Kubernetes cluster.
     Use this tool when users ask for cluster overview, summary, general stats,
     or want to understand the overall cluster state.
     Returns counts of namespaces, pods, nodes, services, and other summary information.
     """
     args_schema: Type[BaseModel] = GetClusterInfoInput
+    args_adapter = TypeAdapter(GetClusterInfoInput)
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, k8s_client: KubernetesClient):
-        super().__init__()
-        self.k8s_client = k8s_client
-
     def _run(self) -> str:
         try:
             cluster_info = self.k8s_client.get_cluster_info()
 
-            response = "**Cluster Overview:**\n\n"
-            response += f"• **Namespaces:** {cluster_info['total_namespaces']}\n"
-            response += f"• **Pods:** {cluster_info['total_pods']} total, {cluster_info['running_pods']} running\n"
-            response += f"• **Nodes:** {cluster_info['total_nodes']} total, {cluster_info['ready_nodes']} ready\n"
-            response += f"• **Services:** {cluster_info['total_services']}\n\n"
+            parts = ["**Cluster Overview:**\n\n"]
+            parts_append = parts.append
+            parts_append(f"• **Namespaces:** {cluster_info['total_namespaces']}\n")
+            parts_append(f"• **Pods:** {cluster_info['total_pods']} total, {cluster_info['running_pods']} running\n")
+            parts_append(f"• **Nodes:** {cluster_info['total_nodes']} total, {cluster_info['ready_nodes']} ready\n")
+            parts_append(f"• **Services:** {cluster_info['total_services']}\n\n")
 
             if cluster_info['node_versions']:
                 versions = ", ".join(cluster_info['node_versions'])
-                response += f"**Kubernetes Versions:** {versions}\n\n"
+                parts_append(f"**Kubernetes Versions:** {versions}\n\n")
 
             if cluster_info['namespaces']:
                 ns_list = ", ".join(cluster_info['namespaces'][:10])
                 if len(cluster_info['namespaces']) > 10:
                     ns_list += f" (and {len(cluster_info['namespaces']) - 10} more)"
-                response += f"**Namespaces:** {ns_list}\n"
+                parts_append(f"**Namespaces:** {ns_list}\n")
 
-            return response
+            return "".join(parts)
 
         except Exception as e:
             return f"Error retrieving cluster information: {str(e)}"
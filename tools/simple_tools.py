@@ -3,20 +3,84 @@ Simple function-based tools for LangGraph.
 These avoid Pydantic issues by being plain functions.
 """
 
+from collections import OrderedDict, defaultdict
 from typing import Optional, Dict, Any
-from k8s_client import KubernetesClient
+import functools
+import inspect
 import json
+import os
+import threading
+import time
 
 # Global client instance
 _k8s_client = None
 
+# Seconds a tool's output is reused for identical arguments (0 disables)
+CACHE_TTL = float(os.getenv("K8S_CACHE_TTL", "10"))
+
+# Entries kept per tool; the least recently used is evicted beyond this
+CACHE_MAXSIZE = 64
+
+
+def ttl_cached_tool(func):
+    """
+    Reuse a tool's output for identical arguments for CACHE_TTL seconds.
+    
+    Collapses the bursts of repeated calls an agent makes while reasoning into a
+    single API round trip. Tools report failures as "Error ..." strings; those
+    aren't cached. Each tool keeps at most CACHE_MAXSIZE entries, and the cache
+    is locked because tools run concurrently on the agent's executor threads.
+    """
+    signature = inspect.signature(func)
+    cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if CACHE_TTL <= 0:
+            return func(*args, **kwargs)
+        
+        # list_pods() and list_pods(namespace=None) share an entry
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = tuple(bound.arguments.items())
+        
+        with lock:
+            entry = cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < CACHE_TTL:
+                cache.move_to_end(key)
+                return entry[1]
+        
+        # Called outside the lock so a slow API call doesn't block other arguments
+        result = func(*args, **kwargs)
+        if not result.startswith("Error"):
+            with lock:
+                cache[key] = (time.monotonic(), result)
+                cache.move_to_end(key)
+                if len(cache) > CACHE_MAXSIZE:
+                    cache.popitem(last=False)
+        return result
+    
+    def cache_clear():
+        with lock:
+            cache.clear()
+    
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
 def initialize_k8s_client():
-    """Initialize the global Kubernetes client."""
+    """Initialize the global Kubernetes client (the process-wide shared instance)."""
     global _k8s_client
     if _k8s_client is None:
-        _k8s_client = KubernetesClient()
+        # Imported on first use so importing the tools module doesn't load the kubernetes package
+        from k8s_client import get_k8s_client
+        
+        # K8S_POOL_MAXSIZE overrides the client's default connection pool size
+        pool_maxsize = os.getenv("K8S_POOL_MAXSIZE")
+        _k8s_client = get_k8s_client(connection_pool_maxsize=int(pool_maxsize) if pool_maxsize else None)
     return _k8s_client
 
+@ttl_cached_tool
 def list_namespaces() -> str:
     """List all namespaces in the Kubernetes cluster."""
     try:
@@ -26,17 +90,19 @@ def list_namespaces() -> str:
         if not namespaces:
             return "No namespaces found in the cluster."
         
-        response = f"Found {len(namespaces)} namespaces:\n\n"
+        parts = [f"Found {len(namespaces)} namespaces:\n\n"]
+        parts_append = parts.append
         for ns in namespaces:
-            response += f"• **{ns['name']}** (Status: {ns['status']})\n"
+            parts_append(f"• **{ns['name']}** (Status: {ns['status']})\n")
             if ns['created']:
-                response += f"  Created: {ns['created']}\n"
+                parts_append(f"  Created: {ns['created']}\n")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"Error retrieving namespaces: {str(e)}"
 
+@ttl_cached_tool
 def list_pods(namespace: Optional[str] = None) -> str:
     """List pods in the Kubernetes cluster, optionally filtered by namespace."""
     try:
@@ -48,29 +114,30 @@ def list_pods(namespace: Optional[str] = None) -> str:
             return f"No pods found{ns_text}."
         
         # Group pods by status for better readability
-        status_groups = {}
+        status_groups = defaultdict(list)
         for pod in pods:
-            status = pod['status']
-            status_groups.setdefault(status, []).append(pod)
+            status_groups[pod['status']].append(pod)
         
         ns_text = f" in namespace '{namespace}'" if namespace else ""
-        response = f"Found {len(pods)} pods{ns_text}:\n\n"
+        parts = [f"Found {len(pods)} pods{ns_text}:\n\n"]
+        parts_append = parts.append
         
         for status, pod_list in status_groups.items():
-            response += f"**{status} ({len(pod_list)} pods):**\n"
+            parts_append(f"**{status} ({len(pod_list)} pods):**\n")
             for pod in pod_list:
                 ready_text = "✓" if pod['ready'] else "✗"
-                response += f"• {pod['name']} ({pod['namespace']}) {ready_text}"
+                parts_append(f"• {pod['name']} ({pod['namespace']}) {ready_text}")
                 if pod['restarts'] > 0:
-                    response += f" [Restarts: {pod['restarts']}]"
-                response += "\n"
-            response += "\n"
+                    parts_append(f" [Restarts: {pod['restarts']}]")
+                parts_append("\n")
+            parts_append("\n")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"Error retrieving pods: {str(e)}"
 
+@ttl_cached_tool
 def list_nodes() -> str:
     """List all nodes in the Kubernetes cluster."""
     try:
@@ -81,25 +148,26 @@ def list_nodes() -> str:
             return "No nodes found in the cluster."
         
         ready_nodes = len([n for n in nodes if n['status'] == 'Ready'])
-        response = f"Found {len(nodes)} nodes ({ready_nodes} ready):\n\n"
+        parts = [f"Found {len(nodes)} nodes ({ready_nodes} ready):\n\n"]
+        parts_append = parts.append
         
         for node in nodes:
             status_icon = "✓" if node['status'] == 'Ready' else "✗"
-            roles = ", ".join(node['roles']) if node['roles'] else "worker"
             
-            response += f"• **{node['name']}** {status_icon}\n"
-            response += f"  Roles: {roles}\n"
-            response += f"  Version: {node['version']}\n"
-            response += f"  OS: {node['os']} ({node['architecture']})\n"
+            parts_append(f"• **{node['name']}** {status_icon}\n")
+            parts_append(f"  Roles: {node['roles_str']}\n")
+            parts_append(f"  Version: {node['version']}\n")
+            parts_append(f"  OS: {node['os']} ({node['architecture']})\n")
             if node['allocatable_cpu'] and node['allocatable_memory']:
-                response += f"  Resources: {node['allocatable_cpu']} CPU, {node['allocatable_memory']} memory\n"
-            response += "\n"
+                parts_append(f"  Resources: {node['allocatable_cpu']} CPU, {node['allocatable_memory']} memory\n")
+            parts_append("\n")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"Error retrieving nodes: {str(e)}"
 
+@ttl_cached_tool
 def list_services(namespace: Optional[str] = None) -> str:
     """List services in the Kubernetes cluster, optionally filtered by namespace."""
     try:
@@ -111,53 +179,55 @@ def list_services(namespace: Optional[str] = None) -> str:
             return f"No services found{ns_text}."
         
         # Group services by type
-        type_groups = {}
+        type_groups = defaultdict(list)
         for svc in services:
-            type_groups.setdefault(svc['type'], []).append(svc)
+            type_groups[svc['type']].append(svc)
         
         ns_text = f" in namespace '{namespace}'" if namespace else ""
-        response = f"Found {len(services)} services{ns_text}:\n\n"
+        parts = [f"Found {len(services)} services{ns_text}:\n\n"]
+        parts_append = parts.append
         
         for svc_type, svc_list in type_groups.items():
-            response += f"**{svc_type} ({len(svc_list)} services):**\n"
+            parts_append(f"**{svc_type} ({len(svc_list)} services):**\n")
             for svc in svc_list:
-                response += f"• **{svc['name']}** ({svc['namespace']})\n"
-                response += f"  Cluster IP: {svc['cluster_ip']}\n"
+                parts_append(f"• **{svc['name']}** ({svc['namespace']})\n")
+                parts_append(f"  Cluster IP: {svc['cluster_ip']}\n")
                 if svc['ports']:
-                    ports = ", ".join([f"{p['port']}/{p['protocol']}" for p in svc['ports']])
-                    response += f"  Ports: {ports}\n"
+                    parts_append(f"  Ports: {svc['ports_str']}\n")
                 if svc['external_ips']:
-                    response += f"  External IPs: {', '.join(svc['external_ips'])}\n"
-            response += "\n"
+                    parts_append(f"  External IPs: {', '.join(svc['external_ips'])}\n")
+            parts_append("\n")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"Error retrieving services: {str(e)}"
 
+@ttl_cached_tool
 def get_cluster_info() -> str:
     """Get general information and statistics about the Kubernetes cluster."""
     try:
         client = initialize_k8s_client()
         cluster_info = client.get_cluster_info()
         
-        response = "**Cluster Overview:**\n\n"
-        response += f"• **Namespaces:** {cluster_info['total_namespaces']}\n"
-        response += f"• **Pods:** {cluster_info['total_pods']} total, {cluster_info['running_pods']} running\n"
-        response += f"• **Nodes:** {cluster_info['total_nodes']} total, {cluster_info['ready_nodes']} ready\n"
-        response += f"• **Services:** {cluster_info['total_services']}\n\n"
+        parts = ["**Cluster Overview:**\n\n"]
+        parts_append = parts.append
+        parts_append(f"• **Namespaces:** {cluster_info['total_namespaces']}\n")
+        parts_append(f"• **Pods:** {cluster_info['total_pods']} total, {cluster_info['running_pods']} running\n")
+        parts_append(f"• **Nodes:** {cluster_info['total_nodes']} total, {cluster_info['ready_nodes']} ready\n")
+        parts_append(f"• **Services:** {cluster_info['total_services']}\n\n")
         
         if cluster_info['node_versions']:
             versions = ", ".join(cluster_info['node_versions'])
-            response += f"**Kubernetes Versions:** {versions}\n\n"
+            parts_append(f"**Kubernetes Versions:** {versions}\n\n")
         
         if cluster_info['namespaces']:
             ns_list = ", ".join(cluster_info['namespaces'][:10])
             if len(cluster_info['namespaces']) > 10:
                 ns_list += f" (and {len(cluster_info['namespaces']) - 10} more)"
-            response += f"**Namespaces:** {ns_list}\n"
+            parts_append(f"**Namespaces:** {ns_list}\n")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"Error retrieving cluster information: {str(e)}"
@@ -3,48 +3,254 @@ Web frontend for the Kubernetes cluster information interface.
 Flask-based web application with a modern UI.
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, render_template, request, session, stream_with_context
 from flask_cors import CORS
+from flask_compress import Compress
 import os
 import sys
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import json
-from typing import Dict, Any
+from pathlib import Path
+import functools
+import hashlib
+import orjson
+import queue
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Any, Optional, Tuple
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agent import create_kubernetes_agent
-from bedrock import BedrockLLM
+# agent and bedrock are imported where first used, so the server starts (and serves
+# static endpoints) without loading langgraph/langchain/boto3
+from tools.simple_tools import get_cluster_info, initialize_k8s_client
+from web.history import HistoryStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create Flask app
-app = Flask(__name__)
+def jres(obj: Any, status: int = 200) -> Response:
+    """JSON response encoded with orjson (drop-in for jsonify)."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
+def conditional_jres(body: bytes) -> Response:
+    """JSON response with a content ETag, or 304 if the client already holds this body."""
+    etag = hashlib.sha1(body).hexdigest()
+    # Flask-Compress tags compressed responses as "<etag>:<encoding>", so compare the base
+    client_etags = {tag.split(':', 1)[0] for tag in request.if_none_match.as_set(include_weak=True)}
+    if etag in client_etags:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+
+# Create Flask app; templates resolve from this file's directory, whatever the cwd
+app = Flask(__name__, root_path=str(Path(__file__).resolve().parent))
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
 CORS(app)
 
+# Compress JSON/HTML responses (formatted pod and service lists are large and repetitive).
+# text/event-stream isn't in the default mimetypes, so streamed answers are sent as-is.
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# Query history lives server-side; the session cookie only carries a session id
+history_store = HistoryStore(os.environ.get(
+    'HISTORY_DB_PATH', str(Path(__file__).resolve().parent / 'history.db')
+))
+
+# Example queries for /api/examples; static, so the JSON is encoded once
+EXAMPLES = [
+    {
+        'category': 'General',
+        'queries': [
+            "What's the cluster overview?",
+            "How is my cluster doing?",
+            "Give me a summary of the cluster"
+        ]
+    },
+    {
+        'category': 'Pods',
+        'queries': [
+            "How many pods are running?",
+            "Show me pods in the default namespace",
+            "Are there any failed pods?",
+            "List all running pods"
+        ]
+    },
+    {
+        'category': 'Nodes',
+        'queries': [
+            "List all nodes",
+            "How many nodes are ready?",
+            "What's the node status?",
+            "Show me node information"
+        ]
+    },
+    {
+        'category': 'Namespaces',
+        'queries': [
+            "List all namespaces",
+            "What namespaces exist?",
+            "Show me the namespaces"
+        ]
+    },
+    {
+        'category': 'Services',
+        'queries': [
+            "Show me all services",
+            "List services in kube-system namespace",
+            "What services are exposed?"
+        ]
+    }
+]
+_EXAMPLES_JSON = orjson.dumps(EXAMPLES)
+
 # Global agent instance
 agent = None
 
+# Bounded pool for agent runs: request threads wait on it, so a burst of queries
+# can't start an unbounded number of concurrent Bedrock + tool chains
+QUERY_WORKERS = int(os.environ.get('WEB_QUERY_WORKERS', 4))
+_query_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix='web-query')
+
+# Normalized query -> future for the agent run currently answering it
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Background warmup (see start_warmup); requests get a 503 while it runs
+_warmup_thread: Optional[threading.Thread] = None
+
+# Readiness probes: the Kubernetes check must answer within READY_TIMEOUT seconds;
+# the Bedrock check is a real model call, so its (checked_at, ok) result is reused
+READY_TIMEOUT = 2
+BEDROCK_READY_TTL = 60
+_bedrock_check = (float('-inf'), False)
+_bedrock_lock = threading.Lock()
+
 
 def initialize_agent():
     """Initialize the Kubernetes agent."""
     global agent
     try:
+        from agent import create_kubernetes_agent
+        
         model_name = os.getenv('BEDROCK_MODEL_NAME', 'claude-3-haiku')
         region = os.getenv('AWS_REGION', 'us-west-2')
         agent = create_kubernetes_agent(model_name=model_name, region=region)
         logger.info("Agent initialized successfully")
         return True
     except Exception as e:
-        logger.error(f"Failed to initialize agent: {e}")
+        logger.error("Failed to initialize agent: %s", e)
         return False
 
 
+def _warmup():
+    """Build the agent and open the Bedrock and Kubernetes connections before traffic arrives."""
+    if not initialize_agent():
+        logger.warning("Warmup failed; requests will retry agent initialization")
+        return
+    
+    # Open the Bedrock TLS session (a no-op in mock mode) and prime the cluster tool cache;
+    # the Bedrock result also seeds the /api/ready/bedrock cache
+    bedrock_ok = agent.bedrock_llm.test_connection()
+    record_bedrock_check(bedrock_ok)
+    overview = get_cluster_info()
+    
+    if not bedrock_ok:
+        logger.warning("Warmup finished, but the Bedrock connection test failed")
+    elif overview.startswith("Error"):
+        logger.warning("Warmup finished, but the cluster is unreachable: %s", overview)
+    else:
+        logger.info("Warmup complete")
+
+
+def start_warmup():
+    """Start warming up in the background so the server can start accepting connections immediately."""
+    global _warmup_thread
+    if _warmup_thread is None:
+        _warmup_thread = threading.Thread(target=_warmup, name='web-warmup', daemon=True)
+        _warmup_thread.start()
+
+
+def session_id() -> str:
+    """Get this browser session's id for history storage, assigning one if needed."""
+    if 'sid' not in session:
+        session['sid'] = uuid.uuid4().hex
+    return session['sid']
+
+
+def warming_up_response() -> Optional[Response]:
+    """A 503 response while warmup is still running, otherwise None."""
+    if _warmup_thread is not None and _warmup_thread.is_alive():
+        return jres({
+            'status': 'starting',
+            'message': 'Agent is warming up, please retry shortly'
+        }, 503)
+    return None
+
+
+def record_bedrock_check(ok: bool):
+    """Store a Bedrock connectivity result for /api/ready/bedrock."""
+    global _bedrock_check
+    _bedrock_check = (time.monotonic(), ok)
+
+
+def bedrock_ready() -> bool:
+    """Whether Bedrock answered a test prompt, re-checked at most every BEDROCK_READY_TTL seconds."""
+    with _bedrock_lock:
+        checked_at, ok = _bedrock_check
+        if time.monotonic() - checked_at >= BEDROCK_READY_TTL:
+            # Checked under the lock so concurrent probes share one model call
+            ok = agent.bedrock_llm.test_connection()
+            record_bedrock_check(ok)
+    return ok
+
+
+def submit_agent_query(user_query: str, run: Callable[[str], str]) -> Tuple[Future, bool]:
+    """
+    Start run(user_query) on the bounded pool, or share the run already answering
+    an identical query (single-flight). Repeats after it finishes are served by
+    the agent's own response cache, which is keyed by the same exact query text;
+    case is kept since Kubernetes names are case-sensitive.
+    
+    Returns:
+        (future for the full answer, whether this call started the run)
+    """
+    key = user_query
+    
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _query_executor.submit(run, user_query)
+            _inflight[key] = future
+    
+    if is_owner:
+        # Added outside the lock: it runs inline if the query has already finished
+        def discard(done: Future):
+            with _inflight_lock:
+                if _inflight.get(key) is done:
+                    del _inflight[key]
+        future.add_done_callback(discard)
+    
+    return future, is_owner
+
+
+def run_agent_query(user_query: str) -> str:
+    """Run an agent query to completion on the bounded pool (see submit_agent_query)."""
+    future, _ = submit_agent_query(user_query, agent.query)
+    return future.result()
+
+
 @app.route('/')
 def index():
     """Main dashboard page."""
@@ -56,28 +262,73 @@ def health_check():
     """Health check endpoint."""
     global agent
     
+    not_ready = warming_up_response()
+    if not_ready is not None:
+        return not_ready
+    
     if agent is None:
         success = initialize_agent()
         if not success:
-            return jsonify({
+            return jres({
                 'status': 'error',
                 'message': 'Agent initialization failed'
-            }), 500
+            }, 500)
     
     try:
-        # Test agent
-        test_response = agent.query("What's the cluster overview?")
-        return jsonify({
+        # Check cluster access through the cached overview tool rather than a
+        # full agent (LLM) round trip on every poll
+        overview = get_cluster_info()
+        if overview.startswith("Error"):
+            raise RuntimeError(overview)
+        return jres({
             'status': 'healthy',
             'timestamp': datetime.now().isoformat(),
             'agent_ready': True
         })
     except Exception as e:
-        return jsonify({
+        return jres({
             'status': 'error',
             'message': str(e),
             'agent_ready': False
-        }), 500
+        }, 500)
+
+
+@app.route('/api/live')
+def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return jres({'status': 'alive'})
+
+
+@app.route('/api/ready')
+def readiness_check():
+    """Readiness probe: the agent is built and the Kubernetes API server answers (no LLM call)."""
+    not_ready = warming_up_response()
+    if not_ready is not None:
+        return not_ready
+    
+    if agent is None:
+        return jres({'ready': False, 'message': 'Agent not initialized'}, 503)
+    
+    if not initialize_k8s_client().check_ready(timeout=READY_TIMEOUT):
+        return jres({'ready': False, 'message': 'Kubernetes API server unreachable'}, 503)
+    
+    return jres({'ready': True})
+
+
+@app.route('/api/ready/bedrock')
+def bedrock_readiness_check():
+    """Bedrock connectivity probe; the result is cached for BEDROCK_READY_TTL seconds."""
+    not_ready = warming_up_response()
+    if not_ready is not None:
+        return not_ready
+    
+    if agent is None:
+        return jres({'ready': False, 'message': 'Agent not initialized'}, 503)
+    
+    if not bedrock_ready():
+        return jres({'ready': False, 'message': 'Bedrock connection test failed'}, 503)
+    
+    return jres({'ready': True})
 
 
 @app.route('/api/query', methods=['POST'])
@@ -85,111 +336,137 @@ def query_cluster():
     """Process natural language queries about the cluster."""
     global agent
     
+    not_ready = warming_up_response()
+    if not_ready is not None:
+        return not_ready
+    
     if agent is None:
         success = initialize_agent()
         if not success:
-            return jsonify({
+            return jres({
                 'error': 'Agent not initialized',
                 'message': 'Please check your AWS and Kubernetes configuration'
-            }), 500
+            }, 500)
     
     try:
         data = request.get_json()
         if not data or 'query' not in data:
-            return jsonify({'error': 'No query provided'}), 400
+            return jres({'error': 'No query provided'}, 400)
         
         user_query = data['query'].strip()
         if not user_query:
-            return jsonify({'error': 'Empty query'}), 400
-        
-        logger.info(f"Processing query: {user_query}")
+            return jres({'error': 'Empty query'}, 400)
         
-        # Process the query
-        response = agent.query(user_query)
+        logger.info("Processing query: %s", user_query)
         
-        # Store in session history
-        if 'query_history' not in session:
-            session['query_history'] = []
-        
-        session['query_history'].append({
-            'query': user_query,
-            'response': response,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Process the query (shared with any identical query already running)
+        response = run_agent_query(user_query)
         
-        # Keep only last 10 queries
-        session['query_history'] = session['query_history'][-10:]
+        # Store in session history (the store keeps the last 10 queries); the
+        # entry and the response share one timestamp
+        timestamp = datetime.now().isoformat()
+        history_store.add(session_id(), user_query, response, timestamp)
         
-        return jsonify({
+        return jres({
             'query': user_query,
             'response': response,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         })
         
     except Exception as e:
-        logger.error(f"Error processing query: {e}")
-        return jsonify({
+        logger.error("Error processing query: %s", e)
+        return jres({
             'error': 'Query processing failed',
             'message': str(e)
-        }), 500
+        }, 500)
+
+
+@app.route('/api/query/stream')
+def query_cluster_stream():
+    """Stream the response to a query (?query=...) as Server-Sent Events."""
+    global agent
+    
+    not_ready = warming_up_response()
+    if not_ready is not None:
+        return not_ready
+    
+    if agent is None:
+        success = initialize_agent()
+        if not success:
+            return jres({
+                'error': 'Agent not initialized',
+                'message': 'Please check your AWS and Kubernetes configuration'
+            }, 500)
+    
+    user_query = request.args.get('query', '').strip()
+    if not user_query:
+        return jres({'error': 'No query provided'}, 400)
+    
+    logger.info("Streaming query: %s", user_query)
+    
+    # Read (or set) the session id now; the cookie can't change once streaming starts
+    sid = session_id()
+    
+    def stream_to_request(query: str, deltas: queue.Queue) -> str:
+        """Run the agent stream on a pool worker, forwarding its deltas to this request."""
+        chunks = []
+        try:
+            for chunk in agent.query_stream(query):
+                chunks.append(chunk)
+                deltas.put(chunk)
+            return ''.join(chunks)
+        finally:
+            deltas.put(None)
+    
+    def events():
+        # Unnamed events carry text deltas; "done" and "query_error" end the stream.
+        # Cached answers and answers shared with an identical running query arrive
+        # whole, in the "done" event alone.
+        try:
+            response = agent.cached_response(user_query)
+            if response is None:
+                # The run holds a slot of the bounded query pool for the whole stream
+                deltas = queue.Queue()
+                future, started = submit_agent_query(
+                    user_query, functools.partial(stream_to_request, deltas=deltas)
+                )
+                if started:
+                    for chunk in iter(deltas.get, None):
+                        yield b"data: " + orjson.dumps({'delta': chunk}) + b"\n\n"
+                response = future.result()
+            
+            done = {
+                'query': user_query,
+                'response': response,
+                'timestamp': datetime.now().isoformat()
+            }
+            history_store.add(sid, done['query'], done['response'], done['timestamp'])
+            yield b"event: done\ndata: " + orjson.dumps(done) + b"\n\n"
+            
+        except Exception as e:
+            logger.error("Error streaming query: %s", e)
+            error = {'error': 'Query processing failed', 'message': str(e)}
+            yield b"event: query_error\ndata: " + orjson.dumps(error) + b"\n\n"
+    
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 
 @app.route('/api/examples')
 def get_examples():
     """Get example queries users can try."""
-    examples = [
-        {
-            'category': 'General',
-            'queries': [
-                "What's the cluster overview?",
-                "How is my cluster doing?",
-                "Give me a summary of the cluster"
-            ]
-        },
-        {
-            'category': 'Pods',
-            'queries': [
-                "How many pods are running?",
-                "Show me pods in the default namespace",
-                "Are there any failed pods?",
-                "List all running pods"
-            ]
-        },
-        {
-            'category': 'Nodes',
-            'queries': [
-                "List all nodes",
-                "How many nodes are ready?",
-                "What's the node status?",
-                "Show me node information"
-            ]
-        },
-        {
-            'category': 'Namespaces',
-            'queries': [
-                "List all namespaces",
-                "What namespaces exist?",
-                "Show me the namespaces"
-            ]
-        },
-        {
-            'category': 'Services',
-            'queries': [
-                "Show me all services",
-                "List services in kube-system namespace",
-                "What services are exposed?"
-            ]
-        }
-    ]
-    
-    return jsonify(examples)
+    return conditional_jres(_EXAMPLES_JSON)
 
 
 @app.route('/api/history')
 def get_history():
     """Get query history for the current session."""
-    history = session.get('query_history', [])
-    return jsonify(history)
+    if 'sid' not in session:
+        return jres([])
+    return conditional_jres(orjson.dumps(history_store.recent(session['sid'])))
 
 
 @app.route('/api/agent-info')
@@ -197,51 +474,60 @@ def get_agent_info():
     """Get information about the agent configuration."""
     global agent
     
+    not_ready = warming_up_response()
+    if not_ready is not None:
+        return not_ready
+    
     if agent is None:
-        return jsonify({'error': 'Agent not initialized'}), 500
+        return jres({'error': 'Agent not initialized'}, 500)
     
     try:
         agent_info = agent.get_agent_info()
-        return jsonify(agent_info)
+        return conditional_jres(orjson.dumps(agent_info))
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jres({'error': str(e)}, 500)
+
+
+@functools.lru_cache(maxsize=1)
+def _models_json() -> bytes:
+    """Encode the (static) model registry once."""
+    from bedrock import BedrockLLM
+    
+    # orjson encodes dicts, not the read-only MappingProxyType views
+    return orjson.dumps({name: dict(config) for name, config in BedrockLLM.list_available_models().items()})
 
 
 @app.route('/api/models')
 def get_available_models():
     """Get available Bedrock models."""
     try:
-        models = BedrockLLM.list_available_models()
-        return jsonify(models)
+        return conditional_jres(_models_json())
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jres({'error': str(e)}, 500)
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return jres({'error': 'Endpoint not found'}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({'error': 'Internal server error'}), 500
+    return jres({'error': 'Internal server error'}, 500)
 
 
 if __name__ == '__main__':
     # Initialize agent on startup
     print("🚀 Starting Kubernetes Cluster Information Web Interface")
-    print("🤖 Initializing agent...")
-    
-    if initialize_agent():
-        print("✅ Agent initialized successfully")
-        print("🌐 Starting web server...")
-        app.run(
-            host='0.0.0.0',
-            port=int(os.environ.get('PORT', 5000)),
-            debug=os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-        )
-    else:
-        print("❌ Failed to initialize agent. Please check your configuration.")
-        sys.exit(1)
+    print("🤖 Initializing agent in the background...")
+    start_warmup()
+    
+    print("🌐 Starting web server...")
+    app.run(
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        debug=os.environ.get('FLASK_DEBUG', 'False').lower() == 'true',
+        threaded=True
+    )
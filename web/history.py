@@ -0,0 +1,72 @@
+"""
+Server-side query history for the web interface.
+Stores each session's recent queries in SQLite so the session cookie only carries an id.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator
+
+
+class HistoryStore:
+    """SQLite-backed query history, keyed by session id."""
+
+    # Entries kept per session
+    MAX_ENTRIES = 10
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the store, creating the table if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        with self._connect() as conn:
+            # WAL lets request threads read while another writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "sid TEXT NOT NULL, "
+                "ts TEXT NOT NULL, "
+                "query TEXT NOT NULL, "
+                "response TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS history_sid ON history (sid, id)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction; each call gets its own, so threads never share one."""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, sid: str, query: str, response: str, timestamp: str):
+        """Record a query and drop the session's entries beyond MAX_ENTRIES."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO history (sid, ts, query, response) VALUES (?, ?, ?, ?)",
+                (sid, timestamp, query, response)
+            )
+            conn.execute(
+                "DELETE FROM history WHERE sid = ? AND id NOT IN "
+                "(SELECT id FROM history WHERE sid = ? ORDER BY id DESC LIMIT ?)",
+                (sid, sid, self.MAX_ENTRIES)
+            )
+
+    def recent(self, sid: str) -> List[Dict[str, Any]]:
+        """Get a session's most recent entries, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT query, response, ts FROM history WHERE sid = ? ORDER BY id DESC LIMIT ?",
+                (sid, self.MAX_ENTRIES)
+            ).fetchall()
+
+        return [
+            {'query': query, 'response': response, 'timestamp': ts}
+            for query, response, ts in reversed(rows)
+        ]